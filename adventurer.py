@@ -315,6 +315,18 @@ class Adventurer:
         """
         return self.__vision_potions
 
+    def get_suggestion_potions(self):
+        """
+        Return a list of suggestion potions the adventurer has in their
+        inventory.
+
+        Returns
+        -------
+        list
+            A list containing SuggestionPotion objects.
+        """
+        return self.__suggestion_potions
+
     def get_items(self):
         """
         Return a tuple of references to all items held in inventory."""
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from enum import Enum, auto
-from maze_items import SuggestionPotion
+from functools import lru_cache
+from types import MethodType
 
 from trivia_maze import SaveGameFileNotFound
 
@@ -11,6 +12,29 @@ _COMMAND_TYPE_OTHER = "other"
 _COMMAND_TYPE_ITEM = "item"
 _COMMAND_TYPE_MOVEMENT = "movement"
 
+# Identifiers for each command context, used to tell the controller which
+# context to make active. These are compared by identity.
+CTX_MAIN_MENU = object()
+CTX_NO_SAVE_FILE_FOUND_MENU = object()
+CTX_MAIN_HELP_MENU = object()
+CTX_PRIMARY_INTERFACE = object()
+CTX_IN_GAME_MENU = object()
+CTX_MAP_LEGEND_MENU = object()
+CTX_COMMAND_LEGEND_MENU = object()
+CTX_SAVE_CONFIRMATION_MENU = object()
+CTX_GAME_WON_MENU = object()
+CTX_GAME_LOST_DIED_MENU = object()
+CTX_GAME_LOST_TRAPPED_MENU = object()
+CTX_SHORT_QA_MENU = object()
+CTX_TRUE_OR_FALSE_QA_MENU = object()
+CTX_MULTIPLE_CHOICE_QA_MENU = object()
+CTX_MAGIC_KEY = object()
+CTX_NEED_MAGIC_KEY = object()
+CTX_DIFFICULTY_MENU = object()
+
+_TRUE_OR_FALSE_OPTIONS = ("<T> True", "<F> False")
+_MULTIPLE_CHOICE_OPTION_LETTERS = ("A", "B", "C", "D")
+
 
 def _strip_key_prefix(user_answer):
     """
@@ -29,12 +53,63 @@ def _strip_key_prefix(user_answer):
     return user_answer[4:]
 
 
+@lru_cache(maxsize=512)
+def _create_options_for_multiple_choice(options):
+    """
+    Generate the options for a multiple choice question. Results are cached
+    since the same question may be posed more than once.
+
+    Parameters
+    ----------
+    options : tuple
+        Tuple of strings containing the raw options of the question.
+
+    Returns
+    -------
+    tuple
+        Tuple of strings
+    """
+    return tuple(
+        f"<{_MULTIPLE_CHOICE_OPTION_LETTERS[ind]}> {option}"
+        for ind, option in enumerate(options)
+    )
+
+
+def _get_initial_hint_content(maze_model):
+    """
+    Determine whether to show the hint label for a hintable Q&A component and,
+    if so, what its contents should be.
+
+    Parameters
+    ----------
+    maze_model : TriviaMazeModel
+        Model holding the adventurer's suggestion potions.
+
+    Returns
+    -------
+    str
+        The content to place in the hint label of a hintable Q&A widget.
+    """
+    num_suggestion_potions = maze_model.get_num_suggestion_potions()
+    if num_suggestion_potions > 0:
+        return _HINT_CONTENT_TEMPLATE % num_suggestion_potions
+
+
 class CommandContext(ABC):
     """
     Interprets keystrokes within a specific context. For example, one context
     might be the main menu while one could be the primary game interface.
+
+    Each concrete context maps the commands it responds to onto the names of
+    the methods that carry them out via its ``_HANDLERS`` class attr. The
+    keystroke bound to each of these commands (see ``COMMANDS``) and the
+    method itself are resolved once at class creation into ``_KEY_HANDLERS``.
     """
 
+    __slots__ = ("_maze_controller", "_maze_model", "_maze_view")
+
+    _HANDLERS = {}
+
     def __init__(self, maze_controller, maze_model, maze_view):
         self._maze_controller = maze_controller
         self._maze_model = maze_model
@@ -50,16 +125,67 @@ class CommandContext(ABC):
                     f"Subclasses of must define the {attr} class attr"
                 )
 
-    @abstractmethod
-    def process_keystroke(self, key):
-        """Interpret a keystroke and perform the relevant actions on the model
-        and view based on the current context."""
+        # Resolve the keystroke bound to each handled command along with the
+        # function that handles it so that neither has to be looked up by
+        # name when a keystroke arrives
+        cls._KEY_HANDLERS = {
+            cls.COMMANDS[command][_COMMAND_KEY_KEY]: getattr(cls, handler_name)
+            for command, handler_name in cls._HANDLERS.items()
+        }
+
+    def get_key_handlers(self):
+        """Get the keystrokes this context responds to along with the actions
+        they trigger.
+
+        Returns
+        -------
+        dict
+            Maps each recognized keystroke to the bound method that should be
+            called when it is received.
+        """
+        return {
+            key: MethodType(handler, self)
+            for key, handler in self._KEY_HANDLERS.items()
+        }
+
+    def _pose_hintable_question_and_answer(
+        self,
+        question_and_answer,
+        set_question,
+        set_hint,
+        show_menu,
+        context_specifier,
+    ):
+        """Fill in the question and initial hint content of a hintable Q&A
+        widget, show it, and switch to the context that interprets keystrokes
+        for it.
+
+        Parameters
+        ----------
+        question_and_answer : HintableQuestionAndAnswer
+            The Q&A flushed from the model.
+        set_question : callable
+            View method that sets the question text of the widget.
+        set_hint : callable
+            View method that sets the hint text of the widget.
+        show_menu : callable
+            View method that shows the widget.
+        context_specifier : object
+            Identifier of the command context to activate.
+        """
+        set_question(question_and_answer.question)
+        set_hint(_get_initial_hint_content(self._maze_model))
+
+        show_menu()
+        self._maze_controller.set_active_context(context_specifier)
 
 
 class MenuCommandContext(CommandContext):
     """Context for interpreting keystrokes when a menu is being shown to the
     user."""
 
+    __slots__ = ()
+
     class Command(Enum):
         """Enumeration used to fix commands to a small finite support set."""
 
@@ -74,30 +200,24 @@ class MenuCommandContext(CommandContext):
         }
     }
 
+    _HANDLERS = {Command.SELECT: "_select"}
+
+    @abstractmethod
+    def _select(self):
+        """Act on the menu option currently selected by the user."""
+
 
 class MainMenuCommandContext(MenuCommandContext):
     """Context for interpreting keystrokes when the user is at the main
     menu."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
+    __slots__ = ()
 
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
+    def _select(self):
+        """Trigger the option currently selected in the main menu."""
         # NOTE: We ignore arrow keys here since the GUI is responsible for
         # having arrow keys traverse the menu. In fact, we actually only care
         # about the user hitting Return inside of this menu.
-        if key != self.COMMANDS[self.Command.SELECT][_COMMAND_KEY_KEY]:
-            return
-
-        # Trigger the currently selected item in the main menu
         selected_option = (
             self._maze_view.get_main_menu_current_selection().lower()
         )
@@ -110,7 +230,7 @@ class MainMenuCommandContext(MenuCommandContext):
             # show difficulty menu
             self._maze_view.show_difficulty_menu()
             # set context to difficulty selection
-            self._maze_controller.set_active_context("difficulty_menu")
+            self._maze_controller.set_active_context(CTX_DIFFICULTY_MENU)
 
         elif selected_option == "load game":
             try:
@@ -120,16 +240,16 @@ class MainMenuCommandContext(MenuCommandContext):
                 # Clear view event log
                 self._maze_view.clear_event_log()
 
-                self._maze_controller.set_active_context("primary_interface")
+                self._maze_controller.set_active_context(CTX_PRIMARY_INTERFACE)
             except SaveGameFileNotFound:
                 self._maze_view.show_no_save_file_found_menu()
                 self._maze_controller.set_active_context(
-                    "no_save_file_found_menu"
+                    CTX_NO_SAVE_FILE_FOUND_MENU
                 )
 
         elif selected_option == "help":
             self._maze_view.show_main_help_menu()
-            self._maze_controller.set_active_context("main_help_menu")
+            self._maze_controller.set_active_context(CTX_MAIN_HELP_MENU)
 
         elif selected_option == "quit game":
             # Exit out of everything and close the window
@@ -140,26 +260,13 @@ class InGameMenuCommandContext(MenuCommandContext):
     """Context for interpreting keystrokes when the user pulls up the in-game
     menu."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
-
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
+    __slots__ = ()
 
+    def _select(self):
+        """Trigger the option currently selected in the in-game menu."""
         # NOTE: We ignore arrow keys here since the GUI is responsible for
         # having arrow keys traverse the menu. In fact, we actually only care
         # about the user hitting Return inside of this menu.
-        if key != self.COMMANDS[self.Command.SELECT][_COMMAND_KEY_KEY]:
-            return
-
-        # Trigger the currently selected item in the main menu
         selected_option = (
             self._maze_view.get_in_game_menu_current_selection().lower()
         )
@@ -168,11 +275,11 @@ class InGameMenuCommandContext(MenuCommandContext):
         # to add to the menu when it creates it in order to avoid duplication
         if selected_option == "back to game":
             self._maze_view.hide_in_game_menu()
-            self._maze_controller.set_active_context("primary_interface")
+            self._maze_controller.set_active_context(CTX_PRIMARY_INTERFACE)
 
         elif selected_option == "display map legend":
             self._maze_view.show_map_legend_menu()
-            self._maze_controller.set_active_context("map_legend_menu")
+            self._maze_controller.set_active_context(CTX_MAP_LEGEND_MENU)
 
         elif selected_option == "display commands":
             # Generate legend symbols/descriptions to display
@@ -188,12 +295,14 @@ class InGameMenuCommandContext(MenuCommandContext):
             self._maze_view.show_command_legend_menu(
                 symbols, descriptions, num_cols=2
             )
-            self._maze_controller.set_active_context("command_legend_menu")
+            self._maze_controller.set_active_context(CTX_COMMAND_LEGEND_MENU)
 
         elif selected_option == "save game":
             self._maze_model.save_game()
             self._maze_view.show_save_confirmation_menu()
-            self._maze_controller.set_active_context("save_confirmation_menu")
+            self._maze_controller.set_active_context(
+                CTX_SAVE_CONFIRMATION_MENU
+            )
 
         elif selected_option == "return to main menu":
             # Have the model create a completely new map and reset all item
@@ -205,7 +314,7 @@ class InGameMenuCommandContext(MenuCommandContext):
             self._maze_view.hide_in_game_menu()
             self._maze_view.show_main_menu()
 
-            self._maze_controller.set_active_context("main_menu")
+            self._maze_controller.set_active_context(CTX_MAIN_MENU)
 
         elif selected_option == "quit game":
             # Exit out of everything and close the window
@@ -216,6 +325,8 @@ class DismissibleCommandContext(CommandContext):
     """Context for interpreting keystrokes when the user is shown a widget
     whose only corresponding action is to be dismissed."""
 
+    __slots__ = ()
+
     class Command(Enum):
         """Enumeration used to fix commands to a small finite support set."""
 
@@ -230,161 +341,100 @@ class DismissibleCommandContext(CommandContext):
         }
     }
 
+    _HANDLERS = {Command.DISMISS: "_dismiss"}
+
+    @abstractmethod
+    def _dismiss(self):
+        """Hide the widget being shown to the user."""
+
 
 class NoSaveFileFoundMenuCommandContext(DismissibleCommandContext):
     """Context for dismissing the widget that informs the user that the game
     could not be loaded because no save game file could be found."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
-
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
+    __slots__ = ()
 
-        if key == self.COMMANDS[self.Command.DISMISS][_COMMAND_KEY_KEY]:
-            self._maze_view.hide_no_save_file_found_menu()
-            self._maze_controller.set_active_context("main_menu")
+    def _dismiss(self):
+        """Hide the notice that no save file could be found and return to the
+        main menu, from which the load was attempted."""
+        self._maze_view.hide_no_save_file_found_menu()
+        self._maze_controller.set_active_context(CTX_MAIN_MENU)
 
 
 class MainHelpMenuCommandContext(DismissibleCommandContext):
     """Context for dismissing the widget that shows the user the help text
     displayed from the corresponding main menu option."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
-
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
+    __slots__ = ()
 
-        if key == self.COMMANDS[self.Command.DISMISS][_COMMAND_KEY_KEY]:
-            self._maze_view.hide_main_help_menu()
-            self._maze_controller.set_active_context("main_menu")
+    def _dismiss(self):
+        """Hide the help text and return to the main menu."""
+        self._maze_view.hide_main_help_menu()
+        self._maze_controller.set_active_context(CTX_MAIN_MENU)
 
 
 class MapLegendCommandContext(DismissibleCommandContext):
     """Context for dismissing the widget that shows the user the symbols used
     inside the map."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
-
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
+    __slots__ = ()
 
-        if key == self.COMMANDS[self.Command.DISMISS][_COMMAND_KEY_KEY]:
-            self._maze_view.hide_map_legend_menu()
-            self._maze_controller.set_active_context("in_game_menu")
+    def _dismiss(self):
+        """Hide the map legend and return to the in-game menu."""
+        self._maze_view.hide_map_legend_menu()
+        self._maze_controller.set_active_context(CTX_IN_GAME_MENU)
 
 
 class CommandLegendCommandContext(DismissibleCommandContext):
     """Context for dismissing the widget that shows the user the commands they
     can use and their corresponding keystrokes."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
-
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
+    __slots__ = ()
 
-        if key == self.COMMANDS[self.Command.DISMISS][_COMMAND_KEY_KEY]:
-            self._maze_view.hide_command_legend_menu()
-            self._maze_controller.set_active_context("in_game_menu")
+    def _dismiss(self):
+        """Hide the command legend and return to the in-game menu."""
+        self._maze_view.hide_command_legend_menu()
+        self._maze_controller.set_active_context(CTX_IN_GAME_MENU)
 
 
 class SaveConfirmationCommandContext(DismissibleCommandContext):
     """Context for dismissing the widget that informs the user that their save
     game attempt was successful."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
+    __slots__ = ()
 
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
-
-        if key == self.COMMANDS[self.Command.DISMISS][_COMMAND_KEY_KEY]:
-            self._maze_view.hide_save_confirmation_menu()
-            self._maze_controller.set_active_context("in_game_menu")
+    def _dismiss(self):
+        """Hide the save confirmation and return to the in-game menu."""
+        self._maze_view.hide_save_confirmation_menu()
+        self._maze_controller.set_active_context(CTX_IN_GAME_MENU)
 
 
 class GameWonCommandContext(DismissibleCommandContext):
     """Context for dismissing the widget that informs the user that they won
     the game."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
+    __slots__ = ()
 
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
-
-        if key == self.COMMANDS[self.Command.DISMISS][_COMMAND_KEY_KEY]:
-            self._maze_view.hide_game_won_menu()
-            self._maze_view.show_main_menu()
-            self._maze_controller.set_active_context("main_menu")
+    def _dismiss(self):
+        """Hide the game won notice and, since the game is over, bring the
+        user back to the main menu."""
+        self._maze_view.hide_game_won_menu()
+        self._maze_view.show_main_menu()
+        self._maze_controller.set_active_context(CTX_MAIN_MENU)
 
 
 class GameLostDiedCommandContext(DismissibleCommandContext):
     """Context for dismissing the widget that informs the user that they lost
     the game because they died."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
-
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
+    __slots__ = ()
 
-        if key == self.COMMANDS[self.Command.DISMISS][_COMMAND_KEY_KEY]:
-            self._maze_view.hide_game_lost_died_menu()
-            self._maze_view.show_main_menu()
-            self._maze_controller.set_active_context("main_menu")
+    def _dismiss(self):
+        """Hide the notice that the adventurer died and, since the game is
+        over, bring the user back to the main menu."""
+        self._maze_view.hide_game_lost_died_menu()
+        self._maze_view.show_main_menu()
+        self._maze_controller.set_active_context(CTX_MAIN_MENU)
 
 
 class GameLostTrappedCommandContext(DismissibleCommandContext):
@@ -393,51 +443,35 @@ class GameLostTrappedCommandContext(DismissibleCommandContext):
     does not contain any magic keys, does not contain the necessary remaining
     pillars not yet picked up, and does not contain the exit."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
-
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
+    __slots__ = ()
 
-        if key == self.COMMANDS[self.Command.DISMISS][_COMMAND_KEY_KEY]:
-            self._maze_view.hide_game_lost_trapped_menu()
-            self._maze_view.show_main_menu()
-            self._maze_controller.set_active_context("main_menu")
+    def _dismiss(self):
+        """Hide the notice that the adventurer is trapped and, since the game
+        is over, bring the user back to the main menu."""
+        self._maze_view.hide_game_lost_trapped_menu()
+        self._maze_view.show_main_menu()
+        self._maze_controller.set_active_context(CTX_MAIN_MENU)
 
 
 class NeedMagicKeyCommandContext(DismissibleCommandContext):
     """Context for dismissing the widget that informs the user that they need a
     magic key to pass through a locked door."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
+    __slots__ = ()
 
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
-
-        if key == self.COMMANDS[self.Command.DISMISS][_COMMAND_KEY_KEY]:
-            self._maze_view.hide_need_magic_key_menu()
-            self._maze_controller.set_active_context("primary_interface")
+    def _dismiss(self):
+        """Hide the notice that a magic key is needed and resume play in the
+        primary interface, leaving the door locked."""
+        self._maze_view.hide_need_magic_key_menu()
+        self._maze_controller.set_active_context(CTX_PRIMARY_INTERFACE)
 
 
 class PrimaryInterfaceCommandContext(CommandContext):
     """The most important context! Interprets keystrokes while the player is
     moving through the maze and using items."""
 
+    __slots__ = ()
+
     class Command(Enum):
         """Enumeration used to fix commands to a small finite support set."""
 
@@ -496,71 +530,71 @@ class PrimaryInterfaceCommandContext(CommandContext):
         },
     }
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
+    _HANDLERS = {
+        Command.MOVE_EAST: "_move_east",
+        Command.MOVE_NORTH: "_move_north",
+        Command.MOVE_WEST: "_move_west",
+        Command.MOVE_SOUTH: "_move_south",
+        Command.USE_HEALING_POTION: "_use_healing_potion",
+        Command.USE_VISION_POTION: "_use_vision_potion",
+        Command.SHOW_IN_GAME_MENU: "_show_in_game_menu",
+    }
+
+    def _show_in_game_menu(self):
+        """Bring up the in-game menu."""
+        self._maze_view.show_in_game_menu()
+        self._maze_controller.set_active_context(CTX_IN_GAME_MENU)
+
+    def _use_healing_potion(self):
+        """Have the adventurer consume a healing potion."""
+        self._maze_model.use_item("healing potion")
+
+    def _use_vision_potion(self):
+        """Have the adventurer consume a vision potion."""
+        self._maze_model.use_item("vision potion")
+
+    def _move_east(self):
+        """Move the adventurer one room to the east."""
+        self._move_adventurer("east")
+
+    def _move_north(self):
+        """Move the adventurer one room to the north."""
+        self._move_adventurer("north")
+
+    def _move_west(self):
+        """Move the adventurer one room to the west."""
+        self._move_adventurer("west")
+
+    def _move_south(self):
+        """Move the adventurer one room to the south."""
+        self._move_adventurer("south")
+
+    def _move_adventurer(self, direction):
+        """Attempt to move the adventurer and respond to any locked door that
+        is standing in the way.
 
         Parameters
         ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
+        direction : str
+            One of 'east', 'north', 'west', or 'south'.
         """
+        directive = self._maze_model.move_adventurer(direction)
+        directive = directive.lower() if directive else None
 
-        # Non-movement commands
-        if (
-            key
-            == self.COMMANDS[self.Command.SHOW_IN_GAME_MENU][_COMMAND_KEY_KEY]
-        ):
-            self._maze_view.show_in_game_menu()
-            self._maze_controller.set_active_context("in_game_menu")
-        elif (
-            key
-            == self.COMMANDS[self.Command.USE_HEALING_POTION][_COMMAND_KEY_KEY]
-        ):
-            self._maze_model.use_item("healing potion")
-        elif (
-            key
-            == self.COMMANDS[self.Command.USE_VISION_POTION][_COMMAND_KEY_KEY]
-        ):
-            self._maze_model.use_item("vision potion")
-        else:
-            # Movement commands
-            KEY_TO_DIRECTION = {
-                self.COMMANDS[self.Command.MOVE_WEST][
-                    _COMMAND_KEY_KEY
-                ]: "west",
-                self.COMMANDS[self.Command.MOVE_EAST][
-                    _COMMAND_KEY_KEY
-                ]: "east",
-                self.COMMANDS[self.Command.MOVE_NORTH][
-                    _COMMAND_KEY_KEY
-                ]: "north",
-                self.COMMANDS[self.Command.MOVE_SOUTH][
-                    _COMMAND_KEY_KEY
-                ]: "south",
-            }
-            direction = KEY_TO_DIRECTION.get(key)
-
-            if direction:
-                # key was a movement command
-                directive = self._maze_model.move_adventurer(direction)
-                directive = directive.lower() if directive else None
-
-                if directive == "use magic key":
-                    self._maze_controller.set_active_context("magic_key")
-                    self._maze_view.show_magic_key_menu()
-                elif directive == "need magic key":
-                    self._maze_controller.set_active_context("need_magic_key")
-                    self._maze_view.show_need_magic_key_menu()
+        if directive == "use magic key":
+            self._maze_controller.set_active_context(CTX_MAGIC_KEY)
+            self._maze_view.show_magic_key_menu()
+        elif directive == "need magic key":
+            self._maze_controller.set_active_context(CTX_NEED_MAGIC_KEY)
+            self._maze_view.show_need_magic_key_menu()
 
 
 class ShortQuestionAndAnswerCommandContext(CommandContext):
     """Command context for interpreting keystrokes while the user is answering
     a short answer Q&A."""
 
+    __slots__ = ("_set_question", "_set_hint", "_show_menu")
+
     class Command(Enum):
         """Enumeration used to fix commands to a small finite support set."""
 
@@ -585,69 +619,83 @@ class ShortQuestionAndAnswerCommandContext(CommandContext):
         },
     }
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
+    _HANDLERS = {
+        Command.USE_SUGGESTION_POTION: "_use_suggestion_potion",
+        Command.SUBMIT_ANSWER: "_submit_answer",
+    }
+
+    def __init__(self, maze_controller, maze_model, maze_view):
+        super().__init__(maze_controller, maze_model, maze_view)
+
+        # View methods used each time a Q&A is posed, bound once up front
+        self._set_question = maze_view.set_short_QA_question
+        self._set_hint = maze_view.set_short_QA_hint
+        self._show_menu = maze_view.show_short_QA_menu
+
+    def pose(self, question_and_answer):
+        """Have the view pose a short answer Q&A to the user and take over
+        interpreting keystrokes.
 
         Parameters
         ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
+        question_and_answer : ShortAnswerQA
+            The Q&A flushed from the model.
         """
+        self._pose_hintable_question_and_answer(
+            question_and_answer,
+            self._set_question,
+            self._set_hint,
+            self._show_menu,
+            CTX_SHORT_QA_MENU,
+        )
 
-        # Retrieve Q&A object held by controller
-        question_and_answer = self._maze_controller.question_and_answer
+    def _submit_answer(self):
+        """Check the answer entered by the user, if any, and inform the
+        model."""
+        maze_view = self._maze_view
+        maze_controller = self._maze_controller
 
-        if key == self.COMMANDS[self.Command.SUBMIT_ANSWER][_COMMAND_KEY_KEY]:
-            # Ensure user has made a selection
-            user_answer = self._maze_view.get_short_QA_user_answer()
-            if not user_answer:
-                return
+        # Ensure user has made a selection
+        user_answer = maze_view.get_short_QA_user_answer()
+        if not user_answer:
+            return
 
-            # Take question and answer object from controller
-            self._maze_controller.question_and_answer = None
+        # Take question and answer object from controller
+        question_and_answer = maze_controller.question_and_answer
+        maze_controller.question_and_answer = None
 
-            user_answer_correct = question_and_answer.answer_is_correct(
-                user_answer
-            )
-            # Hide Q&A widget
-            self._maze_view.hide_short_QA_menu()
-            self._maze_view.clear_short_QA_user_answer()
+        user_answer_correct = question_and_answer.answer_is_correct(
+            user_answer
+        )
+        # Hide Q&A widget
+        maze_view.hide_short_QA_menu()
+        maze_view.clear_short_QA_user_answer()
 
-            # Return command interpretation to primary interface
-            self._maze_controller.set_active_context("primary_interface")
+        # Return command interpretation to primary interface
+        maze_controller.set_active_context(CTX_PRIMARY_INTERFACE)
 
-            # Inform the model
-            # NOTE: This will cause the model to update its observers
-            self._maze_model.inform_player_answer_correct_or_incorrect(
-                user_answer_correct
-            )
+        # Inform the model
+        # NOTE: This will cause the model to update its observers
+        self._maze_model.inform_player_answer_correct_or_incorrect(
+            user_answer_correct
+        )
 
-        elif (
-            key
-            == self.COMMANDS[self.Command.USE_SUGGESTION_POTION][
-                _COMMAND_KEY_KEY
-            ]
-        ):
-            # If user has at least one suggestion potion, use it
-            adventurer_items = self._maze_model.get_adventurer_items()
-            num_suggestion_potions = sum(
-                isinstance(x, SuggestionPotion) for x in adventurer_items
+    def _use_suggestion_potion(self):
+        """If user has at least one suggestion potion, use it to reveal a
+        hint."""
+        if self._maze_model.get_num_suggestion_potions() > 0:
+            self._maze_model.use_item("suggestion potion")
+            self._set_hint(
+                self._maze_controller.question_and_answer.get_hint()
             )
-            if num_suggestion_potions > 0:
-                self._maze_model.use_item("suggestion potion")
-                self._maze_view.set_short_QA_hint(
-                    question_and_answer.get_hint()
-                )
 
 
 class TrueOrFalseQuestionAndAnswerCommandContext(CommandContext):
     """Command context for interpreting keystrokes while the user is answering
     a true-or-false Q&A."""
 
+    __slots__ = ("_set_question", "_set_options", "_show_menu")
+
     class Command(Enum):
         """Enumeration used to fix commands to a small finite support set."""
 
@@ -678,59 +726,84 @@ class TrueOrFalseQuestionAndAnswerCommandContext(CommandContext):
         },
     }
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
+    _HANDLERS = {
+        Command.SELECT_TRUE: "_select_true",
+        Command.SELECT_FALSE: "_select_false",
+        Command.SUBMIT_ANSWER: "_submit_answer",
+    }
+
+    def __init__(self, maze_controller, maze_model, maze_view):
+        super().__init__(maze_controller, maze_model, maze_view)
+
+        # View methods used each time a Q&A is posed, bound once up front
+        self._set_question = maze_view.set_true_or_false_QA_question
+        self._set_options = maze_view.set_true_or_false_QA_options
+        self._show_menu = maze_view.show_true_or_false_QA_menu
+
+    def pose(self, question_and_answer):
+        """Have the view pose a true-or-false Q&A to the user and take over
+        interpreting keystrokes.
 
         Parameters
         ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
+        question_and_answer : TrueOrFalseQA
+            The Q&A flushed from the model.
         """
+        self._set_question(question_and_answer.question)
+        self._set_options(_TRUE_OR_FALSE_OPTIONS)
 
-        if key == self.COMMANDS[self.Command.SUBMIT_ANSWER][_COMMAND_KEY_KEY]:
-            # Ensure user has made a selection
-            user_answer = self._maze_view.get_true_or_false_QA_user_answer()
-            if not user_answer:
-                return
+        self._show_menu()
+        self._maze_controller.set_active_context(CTX_TRUE_OR_FALSE_QA_MENU)
 
-            user_answer = _strip_key_prefix(user_answer)
+    def _submit_answer(self):
+        """Check the answer selected by the user, if any, and inform the
+        model."""
+        maze_view = self._maze_view
+        maze_controller = self._maze_controller
 
-            # Take question and answer object from controller
-            question_and_answer = self._maze_controller.question_and_answer
-            self._maze_controller.question_and_answer = None
+        # Ensure user has made a selection
+        user_answer = maze_view.get_true_or_false_QA_user_answer()
+        if not user_answer:
+            return
 
-            user_answer_correct = question_and_answer.answer_is_correct(
-                user_answer
-            )
+        user_answer = _strip_key_prefix(user_answer)
 
-            # Hide Q&A widget
-            self._maze_view.hide_true_or_false_QA_menu()
-            self._maze_view.clear_true_or_false_QA_user_answer()
+        # Take question and answer object from controller
+        question_and_answer = maze_controller.question_and_answer
+        maze_controller.question_and_answer = None
 
-            # Return command interpretation to primary interface
-            self._maze_controller.set_active_context("primary_interface")
+        user_answer_correct = question_and_answer.answer_is_correct(
+            user_answer
+        )
 
-            # Inform the model
-            # NOTE: This will cause the model to update its observers
-            self._maze_model.inform_player_answer_correct_or_incorrect(
-                user_answer_correct
-            )
+        # Hide Q&A widget
+        maze_view.hide_true_or_false_QA_menu()
+        maze_view.clear_true_or_false_QA_user_answer()
+
+        # Return command interpretation to primary interface
+        maze_controller.set_active_context(CTX_PRIMARY_INTERFACE)
 
-        elif key == self.COMMANDS[self.Command.SELECT_TRUE][_COMMAND_KEY_KEY]:
-            self._maze_view.select_true_or_false_QA_user_answer(0)
+        # Inform the model
+        # NOTE: This will cause the model to update its observers
+        self._maze_model.inform_player_answer_correct_or_incorrect(
+            user_answer_correct
+        )
+
+    def _select_true(self):
+        """Select the 'True' option."""
+        self._maze_view.select_true_or_false_QA_user_answer(0)
 
-        elif key == self.COMMANDS[self.Command.SELECT_FALSE][_COMMAND_KEY_KEY]:
-            self._maze_view.select_true_or_false_QA_user_answer(1)
+    def _select_false(self):
+        """Select the 'False' option."""
+        self._maze_view.select_true_or_false_QA_user_answer(1)
 
 
 class MultipleChoiceQuestionAndAnswerCommandContext(CommandContext):
     """Command context for interpreting keystrokes while the user is answering
     a multiple choice Q&A."""
 
+    __slots__ = ("_set_question", "_set_options", "_set_hint", "_show_menu")
+
     class Command(Enum):
         """Enumeration used to fix commands to a small finite support set."""
 
@@ -781,84 +854,112 @@ class MultipleChoiceQuestionAndAnswerCommandContext(CommandContext):
         },
     }
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
-
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
-
-        # Retrieve Q&A object held by controller
-        question_and_answer = self._maze_controller.question_and_answer
+    _HANDLERS = {
+        Command.USE_SUGGESTION_POTION: "_use_suggestion_potion",
+        Command.SELECT_A: "_select_a",
+        Command.SELECT_B: "_select_b",
+        Command.SELECT_C: "_select_c",
+        Command.SELECT_D: "_select_d",
+        Command.SUBMIT_ANSWER: "_submit_answer",
+    }
 
-        if key == self.COMMANDS[self.Command.SUBMIT_ANSWER][_COMMAND_KEY_KEY]:
-            # Ensure user has made a selection
-            user_answer = self._maze_view.get_multiple_choice_QA_user_answer()
-            if not user_answer:
-                return
+    def __init__(self, maze_controller, maze_model, maze_view):
+        super().__init__(maze_controller, maze_model, maze_view)
 
-            user_answer = _strip_key_prefix(user_answer)
+        # View methods used each time a Q&A is posed, bound once up front
+        self._set_question = maze_view.set_multiple_choice_QA_question
+        self._set_options = maze_view.set_multiple_choice_QA_options
+        self._set_hint = maze_view.set_multiple_choice_QA_hint
+        self._show_menu = maze_view.show_multiple_choice_QA_menu
 
-            # Take question and answer object from controller
-            self._maze_controller.question_and_answer = None
+    def pose(self, question_and_answer):
+        """Have the view pose a multiple choice Q&A to the user and take over
+        interpreting keystrokes.
 
-            user_answer_correct = question_and_answer.answer_is_correct(
-                user_answer
+        Parameters
+        ----------
+        question_and_answer : MultipleChoiceQA
+            The Q&A flushed from the model.
+        """
+        self._set_options(
+            _create_options_for_multiple_choice(
+                tuple(question_and_answer.options)
             )
+        )
+        self._pose_hintable_question_and_answer(
+            question_and_answer,
+            self._set_question,
+            self._set_hint,
+            self._show_menu,
+            CTX_MULTIPLE_CHOICE_QA_MENU,
+        )
+
+    def _submit_answer(self):
+        """Check the option selected by the user, if any, and inform the
+        model."""
+        maze_view = self._maze_view
+        maze_controller = self._maze_controller
 
-            # Hide Q&A widget
-            self._maze_view.hide_multiple_choice_QA_menu()
-            self._maze_view.clear_multiple_choice_QA_user_answer()
+        # Ensure user has made a selection
+        user_answer = maze_view.get_multiple_choice_QA_user_answer()
+        if not user_answer:
+            return
 
-            # Return command interpretation to primary interface
-            self._maze_controller.set_active_context("primary_interface")
+        user_answer = _strip_key_prefix(user_answer)
 
-            # Inform the model
-            # NOTE: This will cause the model to update its observers
-            self._maze_model.inform_player_answer_correct_or_incorrect(
-                user_answer_correct
-            )
+        # Take question and answer object from controller
+        question_and_answer = maze_controller.question_and_answer
+        maze_controller.question_and_answer = None
 
-        elif key == self.COMMANDS[self.Command.SELECT_A][_COMMAND_KEY_KEY]:
-            self._maze_view.select_multiple_choice_QA_user_answer(0)
+        user_answer_correct = question_and_answer.answer_is_correct(
+            user_answer
+        )
 
-        elif key == self.COMMANDS[self.Command.SELECT_B][_COMMAND_KEY_KEY]:
-            self._maze_view.select_multiple_choice_QA_user_answer(1)
+        # Hide Q&A widget
+        maze_view.hide_multiple_choice_QA_menu()
+        maze_view.clear_multiple_choice_QA_user_answer()
 
-        elif key == self.COMMANDS[self.Command.SELECT_C][_COMMAND_KEY_KEY]:
-            self._maze_view.select_multiple_choice_QA_user_answer(2)
+        # Return command interpretation to primary interface
+        maze_controller.set_active_context(CTX_PRIMARY_INTERFACE)
 
-        elif key == self.COMMANDS[self.Command.SELECT_D][_COMMAND_KEY_KEY]:
-            self._maze_view.select_multiple_choice_QA_user_answer(3)
+        # Inform the model
+        # NOTE: This will cause the model to update its observers
+        self._maze_model.inform_player_answer_correct_or_incorrect(
+            user_answer_correct
+        )
 
-        elif (
-            key
-            == self.COMMANDS[self.Command.USE_SUGGESTION_POTION][
-                _COMMAND_KEY_KEY
-            ]
-        ):
-            # If user has at least one suggestion potion, use it
-            adventurer_items = self._maze_model.get_adventurer_items()
-            num_suggestion_potions = sum(
-                isinstance(x, SuggestionPotion) for x in adventurer_items
+    def _select_a(self):
+        """Select option A."""
+        self._maze_view.select_multiple_choice_QA_user_answer(0)
+
+    def _select_b(self):
+        """Select option B."""
+        self._maze_view.select_multiple_choice_QA_user_answer(1)
+
+    def _select_c(self):
+        """Select option C."""
+        self._maze_view.select_multiple_choice_QA_user_answer(2)
+
+    def _select_d(self):
+        """Select option D."""
+        self._maze_view.select_multiple_choice_QA_user_answer(3)
+
+    def _use_suggestion_potion(self):
+        """If user has at least one suggestion potion, use it to reveal a
+        hint."""
+        if self._maze_model.get_num_suggestion_potions() > 0:
+            self._maze_model.use_item("suggestion potion")
+            self._set_hint(
+                self._maze_controller.question_and_answer.get_hint()
             )
-            if num_suggestion_potions > 0:
-                self._maze_model.use_item("suggestion potion")
-                self._maze_view.set_multiple_choice_QA_hint(
-                    question_and_answer.get_hint()
-                )
 
 
 class MagicKeyCommandContext(CommandContext):
     """Command context for asking the user if they want to consume one of their
     magic keys when trying to pass through a locked door."""
 
+    __slots__ = ()
+
     class Command(Enum):
         """Enumeration used to fix commands to a small finite support set."""
 
@@ -882,61 +983,45 @@ class MagicKeyCommandContext(CommandContext):
         },
     }
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
-
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
+    _HANDLERS = {
+        Command.USE_MAGIC_KEY: "_use_magic_key",
+        Command.DISMISS: "_dismiss",
+    }
 
-        if key == self.COMMANDS[self.Command.USE_MAGIC_KEY][_COMMAND_KEY_KEY]:
-            self._maze_model.use_item("magic key")
+    def _use_magic_key(self):
+        """Consume a magic key to unlock the door."""
+        # NOTE: Hand control back to the primary interface before using the
+        # key, since moving through the door may end the game and the
+        # controller must be free to switch to the game-over context
+        self._maze_controller.set_active_context(CTX_PRIMARY_INTERFACE)
+        self._maze_view.hide_magic_key_menu()
 
-            self._maze_controller.set_active_context("primary_interface")
-            self._maze_view.hide_magic_key_menu()
+        self._maze_model.use_item("magic key")
 
-        elif key == self.COMMANDS[self.Command.DISMISS][_COMMAND_KEY_KEY]:
-            self._maze_controller.set_active_context("primary_interface")
-            self._maze_view.hide_magic_key_menu()
+    def _dismiss(self):
+        """Leave the door locked."""
+        self._maze_controller.set_active_context(CTX_PRIMARY_INTERFACE)
+        self._maze_view.hide_magic_key_menu()
 
 
 class DifficultyMenuCommandContext(MenuCommandContext):
     """Context for interpreting keystrokes when the user pulls up the
     difficulty menu."""
 
-    def process_keystroke(self, key):
-        """
-        Interact with view and model based on the keystroke ``key`` received
-        from the view.
-
-        Parameters
-        ----------
-        key : str
-            A keystroke input. This may be a single character, e.g. 'a' if the
-            'a' key is pressed, or could be something like 'Return' or
-            'Escape'.
-        """
+    __slots__ = ()
 
-        if key != self.COMMANDS[self.Command.SELECT][_COMMAND_KEY_KEY]:
-            return
-
-        selected_option = (
-            self._maze_view.get_difficulty_menu_selection().lower()
-        )
-        self._maze_view.hide_difficulty_menu()
+    def _select(self):
+        """Start a new game at the difficulty currently selected."""
+        maze_view = self._maze_view
+        selected_option = maze_view.get_difficulty_menu_selection().lower()
+        maze_view.hide_difficulty_menu()
         self._maze_model.reset(selected_option)
-        self._maze_view.reset_inventories()
+        maze_view.reset_inventories()
 
         # Clear view event log
-        self._maze_view.clear_event_log()
-        self._maze_view.hide_main_menu()
-        self._maze_controller.set_active_context("primary_interface")
+        maze_view.clear_event_log()
+        maze_view.hide_main_menu()
+        self._maze_controller.set_active_context(CTX_PRIMARY_INTERFACE)
 
 
 IN_GAME_MENU_KEY = PrimaryInterfaceCommandContext.COMMANDS[
@@ -952,3 +1037,9 @@ DISMISS_KEYS = (
 USE_SUGGESTION_POTION_KEY = ShortQuestionAndAnswerCommandContext.COMMANDS[
     ShortQuestionAndAnswerCommandContext.Command.USE_SUGGESTION_POTION
 ][_COMMAND_KEY_KEY]
+
+# Only the number of suggestion potions held varies between hints
+_HINT_CONTENT_TEMPLATE = (
+    f"To see a hint, press <{USE_SUGGESTION_POTION_KEY}> to use one of your "
+    "%d suggestion potions."
+)
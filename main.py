@@ -17,7 +17,8 @@ if __name__ == "__main__":
 
     maze_model = TriviaMaze(NUM_ROWS, NUM_COLS, DB_FILE_PATH)
 
-    # NOTE: The controller will create a view object internally
+    # NOTE: The controller will create a view object internally once the main
+    # event loop is started
     maze_controller = TextTriviaMazeController(maze_model)
 
     # Start the main event loop
@@ -20,6 +20,39 @@ from view_config import (
 )
 
 
+class RoomStringWidthMismatch(ValueError):
+    """Raised if a line of a room's string representation does not span the
+    same number of characters as every other room in the map."""
+
+
+# Symbols used to draw the sides of a room
+_WALL_SYMBOL = ROOM_SIDE_SYMBOLS[RoomSides.WALL][ROOM_SIDE_SYMBOL_KEY]
+_DOOR_NS_SYMBOL = ROOM_SIDE_SYMBOLS[RoomSides.DOOR_NORTH_SOUTH][
+    ROOM_SIDE_SYMBOL_KEY
+]
+_DOOR_EW_SYMBOL = ROOM_SIDE_SYMBOLS[RoomSides.DOOR_EAST_WEST][
+    ROOM_SIDE_SYMBOL_KEY
+]
+_DOOR_LOCKED_SYMBOL = ROOM_SIDE_SYMBOLS[RoomSides.DOOR_LOCKED][
+    ROOM_SIDE_SYMBOL_KEY
+]
+_DOOR_PERMANENTLY_LOCKED_SYMBOL = ROOM_SIDE_SYMBOLS[
+    RoomSides.DOOR_PERMANENTLY_LOCKED
+][ROOM_SIDE_SYMBOL_KEY]
+
+# Room contents used to represent a room holding a single item of each type
+_ITEM_TYPES_TO_ROOM_CONTENTS = {
+    HealingPotion: RoomContents.HEALING_POTION,
+    VisionPotion: RoomContents.VISION_POTION,
+    SuggestionPotion: RoomContents.VISION_POTION,
+    AbstractionPillar: RoomContents.ABSTRACTION_PILLAR,
+    EncapsulationPillar: RoomContents.ENCAPSULATION_PILLAR,
+    InheritancePillar: RoomContents.INHERITANCE_PILLAR,
+    PolymorphismPillar: RoomContents.POLYMORPHISM_PILLAR,
+    MagicKey: RoomContents.MAGIC_KEY,
+}
+
+
 class MazeMap:
     """
     Contains a string representation of all rooms an adventurer has either
@@ -31,6 +64,16 @@ class MazeMap:
         How many rows of rooms there are in the maze.
     __room_strings : 2D list of str
         The string representation for each room in the map.
+    __map_chars : bytearray
+        The characters of the rendered map, one line of characters after
+        another with each line terminated by a newline. Every room occupies a
+        fixed-size block of it, so a room can be redrawn in place.
+    __line_stride : int
+        Number of characters (including the newline) in each line of the map.
+    __room_width : int
+        Number of characters spanned by each line of a room.
+    __map_string : str or None
+        The rendered map, or None if it must be decoded from `__map_chars`.
     __padding_col : str
         The spacing character(s) to use between vertical character columns in
         the string representation of a room.
@@ -64,49 +107,28 @@ class MazeMap:
             [self.__hidden_room] * num_cols for _ in range(num_rows)
         ]
 
+        # Characters of the rendered map. Rooms are written directly into
+        # their block when they change, so rendering the map only requires
+        # decoding it.
+        # NOTE: This relies on all of the map symbols being ASCII characters
+        hidden_room_lines = self.__hidden_room.splitlines()
+        self.__room_width = len(hidden_room_lines[0])
+        self.__line_stride = num_cols * self.__room_width + 1
+        self.__map_chars = bytearray(
+            (" " * (self.__line_stride - 1) + "\n").encode("ascii")
+            * (num_rows * num_char_subrows)
+        )
+        self.__map_string = None
+
     def __str__(self):
         """Join string representations for each room to give a global visual
         representation of the maze (with unexposed parts represented with
         spaces)."""
+        if self.__map_string is None:
+            # Leave off the newline ending the last line
+            self.__map_string = self.__map_chars[:-1].decode("ascii")
 
-        printable_char_lines = [
-            [] for _ in range(self.__num_rows * self.__num_char_subrows)
-        ]
-
-        for row in range(0, self.__num_rows):
-            # Stringify this row
-            this_row_room_strs = self.__room_strings[row][:]
-
-            # Create a list with NUM_CHAR_SUBROWS empty sublists. As we loop
-            # over the rooms in this row, we'll fill in these lists in stride.
-            for room_str in this_row_room_strs:
-                room_str_split = room_str.splitlines()
-                # Add the char rows in this room to the appropriate sublists
-                for room_char_line_ind, room_char_line in enumerate(
-                    room_str_split
-                ):
-                    this_global_char_line_index = (
-                        row * self.__num_char_subrows + room_char_line_ind
-                    )
-
-                    # First room in this row -> do not omit first
-                    # column of characters even if option to eliminate
-                    # duplicate dividers is on
-                    char_line_to_append = room_char_line
-
-                    printable_char_lines[this_global_char_line_index].append(
-                        char_line_to_append
-                    )
-
-        maze_string = ""
-        for char_row in printable_char_lines:
-            if char_row:
-                maze_string += ("").join(char_row) + "\n"
-
-        # Remove final newline
-        maze_string = maze_string.rstrip("\n")
-
-        return maze_string
+        return self.__map_string
 
     def update_room(self, room):
         """
@@ -120,13 +142,67 @@ class MazeMap:
         room : Room
             A room in the maze. Must have a `coords` attr to get x and y
             coordinates in maze, as well as a str representation.
+
+        Raises
+        ------
+        RoomStringWidthMismatch
+            If the room's string representation doesn't fit the block of
+            characters each room occupies in the map (e.g. the adventurer
+            can't be drawn in a room when no padding column is used).
         """
         # Go to element in room strings corresponding to this room
         room_row, room_col = room.coords
         if room.visited:
-            self.__room_strings[room_row][room_col] = self.__get_room_str(room)
+            room_str = self.__get_room_str(room)
         else:
-            self.__room_strings[room_row][room_col] = self.__hidden_room
+            room_str = self.__hidden_room
+
+        # Only invalidate the rendered map if the room actually changed
+        if room_str != self.__room_strings[room_row][room_col]:
+            self.__write_room_chars(room_row, room_col, room_str)
+            self.__room_strings[room_row][room_col] = room_str
+            self.__map_string = None
+
+    def __write_room_chars(self, room_row, room_col, room_str):
+        """Overwrite the block of characters a room occupies in the map.
+
+        Parameters
+        ----------
+        room_row : int
+            Row of the room in the maze.
+        room_col : int
+            Column of the room in the maze.
+        room_str : str
+            String representation of the room, with each of its character
+            lines terminated by a newline.
+
+        Raises
+        ------
+        RoomStringWidthMismatch
+            If any line of ``room_str`` is wider or narrower than the block
+            each room occupies. Writing such a line would resize the buffer
+            and shift every room after it.
+        """
+        room_width = self.__room_width
+        char_lines = [
+            char_line.encode("ascii") for char_line in room_str.splitlines()
+        ]
+        for char_line in char_lines:
+            if len(char_line) != room_width:
+                raise RoomStringWidthMismatch(
+                    f"Room at {(room_row, room_col)} has a line of "
+                    f"{len(char_line)} characters, but every room in the map "
+                    f"spans {room_width}."
+                )
+
+        line_stride = self.__line_stride
+        offset = (
+            room_row * self.__num_char_subrows * line_stride
+            + room_col * room_width
+        )
+        for char_line in char_lines:
+            self.__map_chars[offset : offset + room_width] = char_line
+            offset += line_stride
 
     def __get_room_symbol(self, room):
         """
@@ -170,18 +246,8 @@ class MazeMap:
             ]
 
         # Room must contain a single item (potion or pillar)
-        item_types_to_room_contents = {
-            HealingPotion: RoomContents.HEALING_POTION,
-            VisionPotion: RoomContents.VISION_POTION,
-            SuggestionPotion: RoomContents.VISION_POTION,
-            AbstractionPillar: RoomContents.ABSTRACTION_PILLAR,
-            EncapsulationPillar: RoomContents.ENCAPSULATION_PILLAR,
-            InheritancePillar: RoomContents.INHERITANCE_PILLAR,
-            PolymorphismPillar: RoomContents.POLYMORPHISM_PILLAR,
-            MagicKey: RoomContents.MAGIC_KEY,
-        }
         only_item = items[0]
-        for item_type, enum_val in item_types_to_room_contents.items():
+        for item_type, enum_val in _ITEM_TYPES_TO_ROOM_CONTENTS.items():
             if isinstance(only_item, item_type):
                 return ROOM_CONTENT_SYMBOLS[enum_val][ROOM_CONTENT_SYMBOL_KEY]
 
@@ -198,19 +264,11 @@ class MazeMap:
         NOTE: A room that contains a pit cannot contain potions or pillars
         """
         room_symbol = self.__get_room_symbol(room)
-        wall_symbol = ROOM_SIDE_SYMBOLS[RoomSides.WALL][ROOM_SIDE_SYMBOL_KEY]
-        door_ns_symbol = ROOM_SIDE_SYMBOLS[RoomSides.DOOR_NORTH_SOUTH][
-            ROOM_SIDE_SYMBOL_KEY
-        ]
-        door_ew_symbol = ROOM_SIDE_SYMBOLS[RoomSides.DOOR_EAST_WEST][
-            ROOM_SIDE_SYMBOL_KEY
-        ]
-        door_locked_symbol = ROOM_SIDE_SYMBOLS[RoomSides.DOOR_LOCKED][
-            ROOM_SIDE_SYMBOL_KEY
-        ]
-        door_permanently_locked_symbol = ROOM_SIDE_SYMBOLS[
-            RoomSides.DOOR_PERMANENTLY_LOCKED
-        ][ROOM_SIDE_SYMBOL_KEY]
+        wall_symbol = _WALL_SYMBOL
+        door_ns_symbol = _DOOR_NS_SYMBOL
+        door_ew_symbol = _DOOR_EW_SYMBOL
+        door_locked_symbol = _DOOR_LOCKED_SYMBOL
+        door_permanently_locked_symbol = _DOOR_PERMANENTLY_LOCKED_SYMBOL
 
         # Form north side
         padding_col = self.__padding_col
@@ -241,13 +299,9 @@ class MazeMap:
             room_str += door_ew_symbol
 
         if room.occupied_by_adventurer:
-            after_adventurer_symbol = None
-            if not padding_col:
-                after_adventurer_symbol = ""
-            elif len(padding_col) == 1:
-                after_adventurer_symbol = padding_col[0]
-            elif len(padding_col) >= 2:
-                after_adventurer_symbol = padding_col[1]
+            # The adventurer takes the place of the first padding character so
+            # that the room stays as wide as any other
+            after_adventurer_symbol = padding_col[1:]
 
             adventurer_symbol = ROOM_CONTENT_SYMBOLS[RoomContents.ADVENTURER][
                 ROOM_CONTENT_SYMBOL_KEY
@@ -38,17 +38,6 @@ class TriviaMaze:
 
         self.__question_and_answer_buffer = []
 
-        # Artificially add a Q&A to the buffer (pretend the user just walked
-        # into a locked door)
-        question = "This is the text of a question"
-        question_type = "multiple_choice"
-        hint = "This is the text of a hint"
-        options = ("option1", "option2", "option3", "option4")
-        answer = "option3"
-        self.__question_and_answer_buffer.append(
-            QuestionAndAnswer(question, question_type, hint, options, answer)
-        )
-
     def save_game(self):
         """Save the current game state to a file."""
         pass
@@ -73,6 +62,18 @@ class TriviaMaze:
         """Move the adventurer in the specified direction (one of 'north',
         'south', 'east', or 'west') and notify all registered observers of
         the change."""
+        # Artificially add a Q&A to the buffer (pretend the user just walked
+        # into a locked door)
+        question = "This is the text of a question"
+        question_type = "multiple_choice"
+        hint = "This is the text of a hint"
+        options = ("option1", "option2", "option3", "option4")
+        answer = "option3"
+        self.__question_and_answer_buffer.append(
+            QuestionAndAnswer(question, question_type, hint, options, answer)
+        )
+        self.__notify_observers_of_question_and_answer()
+
         self.__notify_observers()
 
     def use_item(self, item_name):
@@ -92,9 +93,11 @@ class TriviaMaze:
         pass
 
     def flush_question_and_answer_buffer(self):
-        """Remove and return the next QuestionAndAnswer instance from the
+        """Remove and return all QuestionAndAnswer instances in the
         buffer."""
-        return self.__question_and_answer_buffer.pop()
+        buffer_contents = self.__question_and_answer_buffer.copy()
+        self.__question_and_answer_buffer.clear()
+        return buffer_contents
 
     def flush_event_log_buffer(self):
         """Clear the event log buffer."""
@@ -113,3 +116,8 @@ class TriviaMaze:
         """Notify all observers of changes to the game state."""
         for observer in self.__observers:
             observer.update()
+
+    def __notify_observers_of_question_and_answer(self):
+        """Notify all observers that a Q&A was put in the Q&A buffer."""
+        for observer in self.__observers:
+            observer.on_question_and_answer_posted()
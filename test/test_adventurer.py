@@ -1,5 +1,7 @@
 import pytest
 
+from maze_items import SuggestionPotion
+
 
 def test_adventurer_set_hit_points(adventurer):
     """Make sure we can successfully add hit points"""
@@ -76,3 +78,14 @@ def test_adventurer_consume_multiple_healing_potions(
     assert adventurer.hit_points == min(
         100, intermediate_hp + second_healing_potion.healing_value
     )
+
+
+def test_adventurer_consume_suggestion_potion(adventurer):
+    """Check that suggestion potions picked up by an adventurer are tracked
+    and removed from their inventory once consumed."""
+    adventurer.pick_up_item(SuggestionPotion())
+    adventurer.pick_up_item(SuggestionPotion())
+    assert len(adventurer.get_suggestion_potions()) == 2
+
+    adventurer.consume_suggestion_potion()
+    assert len(adventurer.get_suggestion_potions()) == 1
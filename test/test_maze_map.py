@@ -0,0 +1,110 @@
+import pytest
+
+from maze_map import MazeMap, RoomStringWidthMismatch
+from room import Room
+from view_config import (
+    RoomContents,
+    ROOM_CONTENT_SYMBOLS,
+    ROOM_CONTENT_SYMBOL_KEY,
+    RoomSides,
+    ROOM_SIDE_SYMBOLS,
+    ROOM_SIDE_SYMBOL_KEY,
+)
+
+WALL = ROOM_SIDE_SYMBOLS[RoomSides.WALL][ROOM_SIDE_SYMBOL_KEY]
+DOOR_EW = ROOM_SIDE_SYMBOLS[RoomSides.DOOR_EAST_WEST][ROOM_SIDE_SYMBOL_KEY]
+EMPTY = ROOM_CONTENT_SYMBOLS[RoomContents.EMPTY][ROOM_CONTENT_SYMBOL_KEY]
+ADVENTURER = ROOM_CONTENT_SYMBOLS[RoomContents.ADVENTURER][
+    ROOM_CONTENT_SYMBOL_KEY
+]
+
+
+def visited_room(row, col):
+    """A visited room with all walls and no contents at the given
+    coordinates."""
+    room = Room(row, col)
+    room.visited = True
+    return room
+
+
+def test_maze_map_starts_hidden():
+    """Check that a map in which no room has been updated is entirely blank,
+    with one line of characters per character subrow of each row of rooms."""
+    maze_map = MazeMap(2, 3, 3, padding_col="  ")
+
+    room_width = 3 + 2 * len("  ")
+    assert str(maze_map) == "\n".join([" " * (3 * room_width)] * 6)
+
+
+def test_maze_map_update_room():
+    """Check that a visited room is drawn into its own block of the map while
+    the rest of the map stays blank."""
+    maze_map = MazeMap(2, 2, 3, padding_col="  ")
+    maze_map.update_room(visited_room(1, 0))
+
+    hidden = " " * 7
+    assert str(maze_map).split("\n") == [
+        hidden * 2,
+        hidden * 2,
+        hidden * 2,
+        f"{WALL}  {WALL}  {WALL}" + hidden,
+        f"{WALL}  {EMPTY}  {WALL}" + hidden,
+        f"{WALL}  {WALL}  {WALL}" + hidden,
+    ]
+
+
+def test_maze_map_update_room_redraws_changed_room():
+    """Check that updating a room again after it changes redraws it in place
+    without disturbing its neighbors."""
+    maze_map = MazeMap(1, 2, 3, padding_col="  ")
+    left_room = visited_room(0, 0)
+    right_room = visited_room(0, 1)
+    maze_map.update_room(left_room)
+    maze_map.update_room(right_room)
+
+    left_room.set_side(Room.EAST, Room.DOOR)
+    left_room.occupied_by_adventurer = True
+    maze_map.update_room(left_room)
+
+    assert str(maze_map).split("\n") == [
+        f"{WALL}  {WALL}  {WALL}" * 2,
+        f"{WALL}{ADVENTURER} {EMPTY}  {DOOR_EW}" + f"{WALL}  {EMPTY}  {WALL}",
+        f"{WALL}  {WALL}  {WALL}" * 2,
+    ]
+
+
+@pytest.mark.parametrize("padding_col", [" ", "  ", "   "])
+def test_maze_map_rooms_keep_their_width(padding_col):
+    """Check that rooms are drawn at the same width as the blank placeholder
+    for any padding, including the room occupied by the adventurer."""
+    maze_map = MazeMap(2, 3, 3, padding_col=padding_col)
+    occupied_room = visited_room(1, 1)
+    occupied_room.occupied_by_adventurer = True
+    maze_map.update_room(occupied_room)
+    maze_map.update_room(visited_room(0, 2))
+
+    room_width = 3 + 2 * len(padding_col)
+    map_lines = str(maze_map).split("\n")
+    assert len(map_lines) == 6
+    assert all(len(line) == 3 * room_width for line in map_lines)
+
+    assert map_lines[4] == (
+        " " * room_width
+        + f"{WALL}{ADVENTURER}{padding_col[1:]}{EMPTY}{padding_col}{WALL}"
+        + " " * room_width
+    )
+
+
+def test_maze_map_rejects_room_of_wrong_width():
+    """Check that a room that can't be drawn at the width of the other rooms
+    is rejected instead of shifting the rest of the map."""
+    maze_map = MazeMap(1, 2, 3, padding_col="")
+    maze_map.update_room(visited_room(0, 1))
+    map_before = str(maze_map)
+
+    occupied_room = visited_room(0, 0)
+    occupied_room.occupied_by_adventurer = True
+    with pytest.raises(RoomStringWidthMismatch):
+        maze_map.update_room(occupied_room)
+
+    assert str(maze_map) == map_before
@@ -1,12 +1,29 @@
-from maze_items import SuggestionPotion
+from collections import deque
+
 from question_and_answer import MultipleChoiceQA, ShortAnswerQA, TrueOrFalseQA
 from trivia_maze_controller import TriviaMazeController
 from text_trivia_maze_view import TextTriviaMazeView
 
 from command_context import (
+    CTX_MAIN_MENU,
+    CTX_NO_SAVE_FILE_FOUND_MENU,
+    CTX_MAIN_HELP_MENU,
+    CTX_PRIMARY_INTERFACE,
+    CTX_IN_GAME_MENU,
+    CTX_MAP_LEGEND_MENU,
+    CTX_COMMAND_LEGEND_MENU,
+    CTX_SAVE_CONFIRMATION_MENU,
+    CTX_GAME_WON_MENU,
+    CTX_GAME_LOST_DIED_MENU,
+    CTX_GAME_LOST_TRAPPED_MENU,
+    CTX_SHORT_QA_MENU,
+    CTX_TRUE_OR_FALSE_QA_MENU,
+    CTX_MULTIPLE_CHOICE_QA_MENU,
+    CTX_MAGIC_KEY,
+    CTX_NEED_MAGIC_KEY,
+    CTX_DIFFICULTY_MENU,
     IN_GAME_MENU_KEY,
     DISMISS_KEYS,
-    USE_SUGGESTION_POTION_KEY,
 )
 from command_context import (
     MainMenuCommandContext,
@@ -28,6 +45,8 @@ from command_context import (
     DifficultyMenuCommandContext,
 )
 
+_MENU_ACCESS_LABEL = f"Press <{IN_GAME_MENU_KEY}> to access the in-game menu"
+
 
 class TextTriviaMazeController(TriviaMazeController):
     """
@@ -37,247 +56,222 @@ class TextTriviaMazeController(TriviaMazeController):
     and get an answer.)
     """
 
+    __slots__ = (
+        "__maze_view",
+        "__contexts",
+        "__transitions",
+        "__game_over_dispatch",
+        "__active_context",
+        "__active_context_specifier",
+        "__active_actions",
+        "__pending_questions_and_answers",
+        "__last_game_status",
+        "question_and_answer",
+    )
+
+    # Command context class to instantiate for each context identifier
+    __CONTEXT_CLASSES = {
+        CTX_MAIN_MENU: MainMenuCommandContext,
+        CTX_NO_SAVE_FILE_FOUND_MENU: NoSaveFileFoundMenuCommandContext,
+        CTX_MAIN_HELP_MENU: MainHelpMenuCommandContext,
+        CTX_PRIMARY_INTERFACE: PrimaryInterfaceCommandContext,
+        CTX_IN_GAME_MENU: InGameMenuCommandContext,
+        CTX_MAP_LEGEND_MENU: MapLegendCommandContext,
+        CTX_COMMAND_LEGEND_MENU: CommandLegendCommandContext,
+        CTX_SAVE_CONFIRMATION_MENU: SaveConfirmationCommandContext,
+        CTX_GAME_WON_MENU: GameWonCommandContext,
+        CTX_GAME_LOST_DIED_MENU: GameLostDiedCommandContext,
+        CTX_GAME_LOST_TRAPPED_MENU: GameLostTrappedCommandContext,
+        CTX_SHORT_QA_MENU: ShortQuestionAndAnswerCommandContext,
+        CTX_TRUE_OR_FALSE_QA_MENU: TrueOrFalseQuestionAndAnswerCommandContext,
+        CTX_MULTIPLE_CHOICE_QA_MENU: (
+            MultipleChoiceQuestionAndAnswerCommandContext
+        ),
+        CTX_MAGIC_KEY: MagicKeyCommandContext,
+        CTX_NEED_MAGIC_KEY: NeedMagicKeyCommandContext,
+        CTX_DIFFICULTY_MENU: DifficultyMenuCommandContext,
+    }
+
+    # Command context that poses each type of Q&A the model may produce
+    __QUESTION_AND_ANSWER_CONTEXTS = {
+        ShortAnswerQA: CTX_SHORT_QA_MENU,
+        TrueOrFalseQA: CTX_TRUE_OR_FALSE_QA_MENU,
+        MultipleChoiceQA: CTX_MULTIPLE_CHOICE_QA_MENU,
+    }
+
     def __init__(self, maze_model):
         super().__init__(maze_model)
 
-        # Create view and do initial configuration based on recognized keystrokes
-        self.__maze_view = TextTriviaMazeView(
-            maze_model, self, "Trivia Maze", DISMISS_KEYS
-        )
+        # NOTE: The view (and with it the tkinter window) is only created once
+        # the main event loop is started (see `start_main_event_loop`)
+        self.__maze_view = None
+        self.__game_over_dispatch = {}
 
-        self.__maze_view.populate_menu_access_label(
-            f"Press <{IN_GAME_MENU_KEY}> to access the in-game menu"
-        )
+        # Command interpretation contexts are only created the first time
+        # they are activated (see `set_active_context`)
+        self.__contexts = {}
 
-        # Initialize command interpretation contexts
-        self.__main_menu_context = MainMenuCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__no_save_file_found_menu_context = (
-            NoSaveFileFoundMenuCommandContext(
-                self, self._maze_model, self.__maze_view
-            )
-        )
-        self.__main_help_menu_context = MainHelpMenuCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__primary_interface_context = PrimaryInterfaceCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__in_game_menu_context = InGameMenuCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__map_legend_menu_context = MapLegendCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__command_legend_menu_context = CommandLegendCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__save_confirmation_menu_context = SaveConfirmationCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__game_won_menu_context = GameWonCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__game_lost_died_menu_context = GameLostDiedCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__game_lost_trapped_menu_context = GameLostTrappedCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__short_QA_context = ShortQuestionAndAnswerCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__true_or_false_QA_context = (
-            TrueOrFalseQuestionAndAnswerCommandContext(
-                self, self._maze_model, self.__maze_view
-            )
-        )
-        self.__multiple_choice_QA_context = (
-            MultipleChoiceQuestionAndAnswerCommandContext(
-                self, self._maze_model, self.__maze_view
-            )
-        )
-        self.__magic_key_context = MagicKeyCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__need_magic_key_context = NeedMagicKeyCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
-        self.__difficulty_menu_context = DifficultyMenuCommandContext(
-            self, self._maze_model, self.__maze_view
-        )
+        # Transition table holding the key -> action mapping of each context
+        # as it is created. The mapping of the active context is kept on hand
+        # so that interpreting a keystroke only ever costs one dict lookup.
+        self.__transitions = {}
 
         # Initialize question and answer (used between different command
         # contexts) attr
         self.question_and_answer = None
 
-        # Player starts out at the main menu, so make that the active context.
-        # NOTE: This sets the `__active_context` instance attr
-        self.set_active_context("main_menu")
+        # Q&As flushed from the model that are still waiting to be posed
+        self.__pending_questions_and_answers = deque()
+
+        # Game status seen on the previous model update
+        self.__last_game_status = None
+
+        # No context is active until the view exists to interact with
+        self.__active_context = None
+        self.__active_context_specifier = None
+        self.__active_actions = {}
 
     def start_main_event_loop(self):
+        if self.__maze_view is None:
+            self.__create_view()
+
+            # Player starts out at the main menu, so make that the active
+            # context
+            self.set_active_context(CTX_MAIN_MENU)
+
         self.__maze_view.mainloop()
 
+    def __create_view(self):
+        """Create the view and do initial configuration based on recognized
+        keystrokes."""
+        maze_view = TextTriviaMazeView(
+            self._maze_model, self, "Trivia Maze", DISMISS_KEYS
+        )
+        self.__maze_view = maze_view
+
+        maze_view.populate_menu_access_label(_MENU_ACCESS_LABEL)
+
+        # Maps each game-over status reported by the model to the view method
+        # that announces it and the context that takes over afterward
+        self.__game_over_dispatch = {
+            "died": (
+                maze_view.show_game_lost_died_menu,
+                CTX_GAME_LOST_DIED_MENU,
+            ),
+            "trapped": (
+                maze_view.show_game_lost_trapped_menu,
+                CTX_GAME_LOST_TRAPPED_MENU,
+            ),
+            "win": (maze_view.show_game_won_menu, CTX_GAME_WON_MENU),
+        }
+
     def process_keystroke(self, key):
-        self.__active_context.process_keystroke(key)
+        action = self.__active_actions.get(key)
+        if action:
+            action()
 
     def get_active_context(self):
         return self.__active_context
 
     def set_active_context(self, context_specifier):
-        contexts = {
-            "main_menu": self.__main_menu_context,
-            "no_save_file_found_menu": self.__no_save_file_found_menu_context,
-            "main_help_menu": self.__main_help_menu_context,
-            "primary_interface": self.__primary_interface_context,
-            "in_game_menu": self.__in_game_menu_context,
-            "map_legend_menu": self.__map_legend_menu_context,
-            "command_legend_menu": self.__command_legend_menu_context,
-            "save_confirmation_menu": self.__save_confirmation_menu_context,
-            "game_won_menu": self.__game_won_menu_context,
-            "game_lost_died_menu": self.__game_lost_died_menu_context,
-            "game_lost_trapped_menu": self.__game_lost_trapped_menu_context,
-            "short_QA_menu": self.__short_QA_context,
-            "true_or_false_QA_menu": self.__true_or_false_QA_context,
-            "multiple_choice_QA_menu": self.__multiple_choice_QA_context,
-            "magic_key": self.__magic_key_context,
-            "need_magic_key": self.__need_magic_key_context,
-            "difficulty_menu": self.__difficulty_menu_context,
-        }
-        self.__active_context = contexts[context_specifier]
+        context = self.__get_context(context_specifier)
 
-    def update(self):
-        """Observer response method to model changes."""
-        # Check if game is over
-        game_status = self._maze_model.game_status()
-        if game_status == "died":
-            self.__maze_view.show_game_lost_died_menu()
-            self.set_active_context("game_lost_died_menu")
-            return
-        elif game_status == "trapped":
-            self.__maze_view.show_game_lost_trapped_menu()
-            self.set_active_context("game_lost_trapped_menu")
-            return
-        elif game_status == "win":
-            self.__maze_view.show_game_won_menu()
-            self.set_active_context("game_won_menu")
-            return
+        self.__active_context = context
+        self.__active_context_specifier = context_specifier
+        self.__active_actions = self.__transitions[context_specifier]
 
-        # If game still ongoing, check if there is a new Q&A to pose to the
-        # user
-        if self.__active_context == self.__primary_interface_context:
-            self.__process_question_and_answer_buffer()
-
-    def __process_question_and_answer_buffer(self):
-        """If the model put a QuestionAndAnswer object in its corresponding
-        buffer, tell the view to pose it to the user and switch to the
-        appropriate command context to get their answer (and, if applicable,
-        allow them to use a suggestion potion)."""
-        self.question_and_answer = (
-            self._maze_model.flush_question_and_answer_buffer()
-        )
-        if self.question_and_answer:
-            if isinstance(self.question_and_answer, ShortAnswerQA):
-                self.__maze_view.set_short_QA_question(
-                    self.question_and_answer.question,
-                )
-
-                self.__maze_view.set_short_QA_hint(
-                    self.__get_initial_hint_content()
-                )
-
-                self.__maze_view.show_short_QA_menu()
-                self.set_active_context("short_QA_menu")
-
-            elif isinstance(self.question_and_answer, TrueOrFalseQA):
-                self.__maze_view.set_true_or_false_QA_question(
-                    self.question_and_answer.question,
-                )
-                self.__maze_view.set_true_or_false_QA_options(
-                    self.__create_options_for_true_false()
-                )
-
-                self.__maze_view.show_true_or_false_QA_menu()
-                self.set_active_context("true_or_false_QA_menu")
-
-            elif isinstance(self.question_and_answer, MultipleChoiceQA):
-                self.__maze_view.set_multiple_choice_QA_question(
-                    self.question_and_answer.question,
-                )
-
-                self.__maze_view.set_multiple_choice_QA_options(
-                    self.__create_options_for_multiple_choice(
-                        self.question_and_answer.options
-                    )
-                )
-
-                self.__maze_view.set_multiple_choice_QA_hint(
-                    self.__get_initial_hint_content()
-                )
-
-                self.__maze_view.show_multiple_choice_QA_menu()
-                self.set_active_context("multiple_choice_QA_menu")
-
-    def __get_initial_hint_content(self):
-        """Determine whether to show the hint label for a hintable Q&A
-        component and, if so, what its contents should be.
+    def __get_context(self, context_specifier):
+        """Get a command context, creating it if it has not been activated
+        before.
+
+        Parameters
+        ----------
+        context_specifier : object
+            One of the ``CTX_*`` identifiers from ``command_context``.
 
         Returns
         -------
-        str
-            The content to place in the hint label of a hintable Q&A widget.
+        CommandContext
+            The context corresponding to the identifier.
         """
+        context = self.__contexts.get(context_specifier)
+        if context is None:
+            context = self.__create_context(context_specifier)
+        return context
 
-        num_suggestion_potions = self.__get_num_suggestion_potions()
-        if num_suggestion_potions > 0:
-            return (
-                f"To see a hint, press <{USE_SUGGESTION_POTION_KEY}> to use one of your "
-                f"{num_suggestion_potions} suggestion potions."
-            )
+    def __create_context(self, context_specifier):
+        """Create a command context and register the keystrokes it recognizes
+        in the transition table.
 
-    def __get_num_suggestion_potions(self):
-        """Get number of suggestion potions held by adventurer from
-        model.
+        Parameters
+        ----------
+        context_specifier : object
+            One of the ``CTX_*`` identifiers from ``command_context``.
 
         Returns
         -------
-        int
-            The number of suggestion potions the adventurer has.
+        CommandContext
+            The newly created context.
         """
-        adventurer_items = self._maze_model.get_adventurer_items()
-
-        # If user has at least one suggestion potion, show hint box
-        return sum(
-            isinstance(item, SuggestionPotion) for item in adventurer_items
+        context = self.__CONTEXT_CLASSES[context_specifier](
+            self, self._maze_model, self.__maze_view
         )
+        self.__contexts[context_specifier] = context
 
-    @staticmethod
-    def __create_options_for_true_false():
-        """
-        Generate the options for a T/F question.
+        self.__transitions[context_specifier] = context.get_key_handlers()
 
-        Returns
-        -------
-        list
-            List of strings
-        """
-        return ["<T> True", "<F> False"]
+        return context
 
-    @staticmethod
-    def __create_options_for_multiple_choice(options):
-        """
-        Generate the options for a multiple choice question.
+    def update(self):
+        """Observer response method to model changes."""
+        # Nothing to present until the view has been created
+        if self.__maze_view is None:
+            return
 
-        Returns
-        -------
-        list
-            List of strings
-        """
-        options_with_prefixes = []
-        ind_to_letter = {0: "A", 1: "B", 2: "C", 3: "D"}
+        # Check if game is over. Game-over handling only needs to happen when
+        # the status changes, so a status that was already handled is skipped.
+        game_status = self._maze_model.game_status()
+        if game_status != self.__last_game_status:
+            self.__last_game_status = game_status
+
+            game_over_state = self.__game_over_dispatch.get(game_status)
+            if game_over_state:
+                show_menu, context_specifier = game_over_state
+                self.__pending_questions_and_answers.clear()
+                show_menu()
+                self.set_active_context(context_specifier)
+                return
+
+        # If game still ongoing, check if there is a Q&A waiting to be posed
+        # to the user
+        if (
+            self.__pending_questions_and_answers
+            and self.__active_context_specifier is CTX_PRIMARY_INTERFACE
+        ):
+            self.__pose_next_question_and_answer()
+
+    def on_question_and_answer_posted(self):
+        """Take the newly posted Q&As out of the model's buffer so they can be
+        posed to the user on the update that follows."""
+        self.__pending_questions_and_answers.extend(
+            self._maze_model.flush_question_and_answer_buffer()
+        )
 
-        for ind, option in enumerate(options):
-            options_with_prefixes.append(f"<{ind_to_letter[ind]}> {option}")
+    def __pose_next_question_and_answer(self):
+        """Tell the view to pose the first pending QuestionAndAnswer to the
+        user and switch to the appropriate command context to get their answer
+        (and, if applicable, allow them to use a suggestion potion).
 
-        return options_with_prefixes
+        Any remaining Q&As are posed in turn as each answer is submitted.
+        """
+        question_and_answer = self.__pending_questions_and_answers.popleft()
+        self.question_and_answer = question_and_answer
+
+        # NOTE: Dispatch is on exact type since none of the Q&A types are
+        # subclassed further. The context knows how to have the view pose its
+        # type of Q&A and makes itself active once it has.
+        context_specifier = self.__QUESTION_AND_ANSWER_CONTEXTS.get(
+            type(question_and_answer)
+        )
+        if context_specifier is not None:
+            self.__get_context(context_specifier).pose(question_and_answer)
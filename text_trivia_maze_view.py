@@ -1,6 +1,6 @@
-import textwrap
-from tkinter import *
-from tkinter.ttk import *
+from functools import lru_cache
+from tkinter import BOTTOM, CENTER, HORIZONTAL, VERTICAL, Tk
+from tkinter.ttk import Label, Separator, Style
 
 from trivia_maze_view import TriviaMazeView
 from maze_map import MazeMap
@@ -39,6 +39,129 @@ from maze_items import (
 )
 
 
+@lru_cache(maxsize=8)
+def _generate_multicolumn_display_text(
+    symbols, descriptions, num_cols, symbol_overrides
+):
+    """Given a set of symbols and descriptions for a legend, pack them into
+    a specified number of formatted columns and join them into the giant
+    string that is displayed. Results are cached since the same legend may be
+    displayed many times.
+
+    Parameters
+    ----------
+    symbols : tuple
+        Abbreviated symbols that need descriptions.
+    descriptions : tuple
+        Description that explain the abbreviated symbols.
+    num_cols : int
+        How many columns of symbol-description pairs should be constructed
+        in the display.
+    symbol_overrides : frozenset
+        Items (pairs) of a mapping from strings in ``symbols`` to strings that
+        should be written into the display instead.
+
+    Returns
+    -------
+    str
+        The rows of the display joined by newlines.
+    """
+    return "\n".join(
+        _generate_rows_for_multicolumn_display(
+            symbols, descriptions, num_cols, symbol_overrides
+        )
+    )
+
+
+def _generate_rows_for_multicolumn_display(
+    symbols, descriptions, num_cols, symbol_overrides
+):
+    """Given a set of symbols and descriptions for a legend, pack them into
+    a specified number of formatted columns so that they can be displayed
+    as a giant string. Symbols can be overridden using a mapping parameter.
+
+    Parameters
+    ----------
+    symbols : tuple
+        Abbreviated symbols that need descriptions.
+    descriptions : tuple
+        Description that explain the abbreviated symbols.
+    num_cols : int
+        How many columns of symbol-description pairs should be constructed
+        in the display.
+    symbol_overrides : frozenset
+        Items (pairs) of a mapping from strings in ``symbols`` to strings that
+        should be written into the display instead, e.g. an space doesn't
+        display well so we replace it with "<space>".
+
+    Yields
+    ------
+    str
+        The individual rows of text that make up the display content. These
+        will typically be joined by newlines by the caller to come up with
+        the final display string.
+    """
+    symbol_overrides = dict(symbol_overrides)
+
+    # Separation to place between columns
+    COL_SEP = "  "
+    SYMBOL_DESC_SEP = ": "
+
+    # Pair up each (possibly overridden) symbol with its description and split
+    # the pairs into display rows of num_cols pairs each. The last row may be
+    # shorter.
+    pairs = [
+        (symbol_overrides.get(symbol, symbol), description)
+        for symbol, description in zip(symbols, descriptions)
+    ]
+    rows = [
+        pairs[row_start : row_start + num_cols]
+        for row_start in range(0, len(pairs), num_cols)
+    ]
+
+    # Find the longest symbol string and description string in each column
+    # with a single pass over the rows
+    symbol_max_len_by_col = [0] * num_cols
+    description_max_len_by_col = [0] * num_cols
+    for row in rows:
+        for col, (symbol, description) in enumerate(row):
+            symbol_max_len_by_col[col] = max(
+                symbol_max_len_by_col[col], len(symbol)
+            )
+            description_max_len_by_col[col] = max(
+                description_max_len_by_col[col], len(description)
+            )
+
+    # Maximum possible width of a given row of chars
+    total_width = (
+        len(COL_SEP) * (num_cols - 1)
+        + sum(symbol_max_len_by_col)
+        + len(SYMBOL_DESC_SEP) * num_cols
+        + sum(description_max_len_by_col)
+    )
+
+    # Build the format for each column once, e.g. "{:>5}: {:<12}"
+    col_formats = [
+        f"{{:>{symbol_max_len}}}{SYMBOL_DESC_SEP}{{:<{description_max_len}}}"
+        for symbol_max_len, description_max_len in zip(
+            symbol_max_len_by_col, description_max_len_by_col
+        )
+    ]
+
+    last_row = len(rows) - 1
+    for row_ind, row in enumerate(rows):
+        row_entry = COL_SEP.join(
+            col_formats[col].format(symbol, description)
+            for col, (symbol, description) in enumerate(row)
+        )
+
+        # Pad the bottom row to the right with spaces
+        if row_ind == last_row:
+            row_entry = row_entry.ljust(total_width)
+
+        yield row_entry
+
+
 class TextTriviaMazeView(TriviaMazeView):
     """A text-based view for the Trivia Maze application that uses tkinter
     (specifically, themed-tkinter aka "ttk").
@@ -63,6 +186,32 @@ class TextTriviaMazeView(TriviaMazeView):
         MagicKey: "Magic Key",
     }
 
+    # Modifier and lock keys, which never correspond to a command on their own
+    __IGNORED_KEYSYMS = frozenset(
+        {
+            "Shift_L",
+            "Shift_R",
+            "Control_L",
+            "Control_R",
+            "Alt_L",
+            "Alt_R",
+            "Caps_Lock",
+            "Num_Lock",
+            "Super_L",
+            "Super_R",
+            "Meta_L",
+            "Meta_R",
+        }
+    )
+
+    # Styles shared by the text and bottom label of every dismissible pop-up
+    __DISMISS_TEXT_STYLE = STYLES["dismiss_text"]["style"]
+    __DISMISS_BOTTOM_LABEL_STYLE = STYLES["dismiss_bottom_label"]["style"]
+
+    # Keycodes of keys whose char is a control character (newline, escape and
+    # linefeed), which are forwarded to the controller by their keysym instead
+    __KEYSYM_KEYCODES = frozenset({13, 27, 10})
+
     def __init__(
         self,
         maze_model,
@@ -73,7 +222,15 @@ class TextTriviaMazeView(TriviaMazeView):
         theme_name=None,
     ):
         super().__init__(maze_model, maze_controller)
-        self.__dismiss_keys = dismiss_keys
+
+        # Messages telling the user how to dismiss a pop-up, shared by all of
+        # the pop-ups that lead back to the same place
+        dismiss_prompt = f"Press {' or '.join(dismiss_keys)} to return to the"
+        self.__dismiss_to_main_menu_message = f"{dismiss_prompt} main menu"
+        self.__dismiss_to_in_game_menu_message = (
+            f"{dismiss_prompt} in-game menu"
+        )
+        self.__dismiss_to_game_message = f"{dismiss_prompt} game"
 
         # Create primary tkinter window and bind mainloop method (might fit
         # better in the driver and we can just pass the main Tk window into the
@@ -82,6 +239,13 @@ class TextTriviaMazeView(TriviaMazeView):
         self.__window.title(title)
         self.mainloop = self.__window.mainloop
 
+        # Identifier of a refresh in response to a model update that has been
+        # scheduled but not yet carried out, if any
+        self.__refresh_id = None
+
+        # Whether the window has been torn down
+        self.__window_destroyed = False
+
         if theme_path and theme_name:
             # To use this theme, clone the relevant repo and then give the path to its
             # azure.tcl file here
@@ -124,74 +288,45 @@ class TextTriviaMazeView(TriviaMazeView):
         # Add separator lines to divide UI cleanly
         # NOTE: The separators need to be created after the primary interface
         # components but before any of the pop-up widgets that can show up on
-        # top of it.
+        # top of it. Since the main menu is created afterward and fills the
+        # entire window, it covers the separators whenever it is shown, so
+        # they only ever need to be placed once.
         self.__separators = self.__create_separators()
+        self.__show_separators()
 
-        # Create game won/lost menus
-        self.__game_won_menu = self.__create_game_won_menu()
-        self.hide_game_won_menu()
-
-        self.__game_lost_died_menu = self.__create_game_lost_died_menu()
-        self.hide_game_lost_died_menu()
-
-        self.__game_lost_trapped_menu = self.__create_game_lost_trapped_menu()
-        self.hide_game_lost_trapped_menu()
-
-        self.__difficulty_menu = self.__create_difficulty_menu()
-        self.hide_difficulty_menu()
-
-        # Create dialog for needing magic key
-        self.__need_magic_key_menu = self.__create_need_magic_key_menu()
-        self.hide_need_magic_key_menu()
-
-        # Create dialog for using magic key
-        self.__magic_key_menu = self.__create_magic_key_menu()
-        self.hide_magic_key_menu()
-
-        # Set up in-game menu
-        self.__in_game_menu = self.__create_in_game_menu()
-        self.hide_in_game_menu()
-
-        # Map legend menu
-        self.__map_legend_menu = self.__create_map_legend_menu()
-        self.hide_map_legend_menu()
-
-        # Create pop-up to confirm user save game
-        self.__save_confirmation_menu = self.__create_save_confirmation_menu()
-        self.hide_save_confirmation_menu()
-
-        # Create empty commands help menu
-        self.__command_legend_menu = self.__create_command_legend_menu()
-        self.hide_command_legend_menu()
-
-        # Create empty short answer question & answer menu
-        self.__short_QA_menu = self.__create_short_QA_menu()
-        self.hide_short_QA_menu()
-
-        # Create empty true or false question & answer menu
-        self.__true_or_false_QA_menu = self.__create_true_or_false_QA_menu()
-        self.hide_true_or_false_QA_menu()
-
-        # Create empty short answer question & answer menu
-        self.__multiple_choice_QA_menu = (
-            self.__create_multiple_choice_QA_menu()
-        )
-        self.hide_multiple_choice_QA_menu()
-
-        # Create main menu and the help menu accessible from it
+        # NOTE: The game won/lost menus are only created the first time they
+        # are shown, since many sessions never get that far. Being created
+        # last also keeps them on top of every other widget.
+        self.__game_won_menu = None
+        self.__game_lost_died_menu = None
+        self.__game_lost_trapped_menu = None
+
+        # NOTE: Pop-ups that only display a message until they're dismissed
+        # are created the first time they are shown (see the corresponding
+        # `show_*` methods). Every other widget already exists by then, so they
+        # end up on top of it.
+        self.__need_magic_key_menu = None
+        self.__magic_key_menu = None
+        self.__map_legend_menu = None
+        self.__save_confirmation_menu = None
+        self.__command_legend_menu = None
+        self.__no_save_file_found_menu = None
+        self.__main_help_menu = None
+
+        # NOTE: The difficulty, in-game and question & answer menus are also
+        # only created the first time they're needed (see the corresponding
+        # `__get_*` methods). Each of them is only ever shown once the widgets
+        # it appears over exist, and the widget that was on top of it before
+        # is always hidden first.
+        self.__difficulty_menu = None
+        self.__in_game_menu = None
+        self.__short_QA_menu = None
+        self.__true_or_false_QA_menu = None
+        self.__multiple_choice_QA_menu = None
+
+        # Create main menu
         self.__main_menu = self.__create_main_menu()
 
-        # Create pop-up to tell user that load game failed because no save file
-        # could be found
-        self.__no_save_file_found_menu = (
-            self.__create_no_save_file_found_menu()
-        )
-        self.hide_no_save_file_found_menu()
-
-        # Help menu accessible from main menu
-        self.__main_help_menu = self.__create_main_help_menu()
-        self.hide_main_help_menu()
-
         # Prevent resizing
         self.__window.resizable(False, False)
 
@@ -204,78 +339,57 @@ class TextTriviaMazeView(TriviaMazeView):
     def __create_separators(self):
         """Creates a set of desired separators and their relevant dimensions,
         packed as Separator-dict 2-tuples."""
-        separators = []
+        map_width = DIMENSIONS["map"]["width"]
+        map_height = DIMENSIONS["map"]["height"]
 
-        # Vertical line along right edge of map
-        separators.append(
+        return (
+            # Vertical line along right edge of map
             (
                 Separator(self.__window, orient=VERTICAL),
-                {
-                    "x": DIMENSIONS["map"]["width"],
-                    "height": DIMENSIONS["map"]["height"],
-                },
-            )
-        )
-
-        # Horizontal line along bottom edge of map
-        separators.append(
+                {"x": map_width, "height": map_height},
+            ),
+            # Horizontal line along bottom edge of map
             (
                 Separator(self.__window, orient=HORIZONTAL),
-                {
-                    "y": DIMENSIONS["map"]["height"],
-                    "width": DIMENSIONS["map"]["width"],
-                },
-            )
-        )
-
-        # Horizonal line under hp gauge
-        separators.append(
+                {"y": map_height, "width": map_width},
+            ),
+            # Horizonal line under hp gauge
             (
                 Separator(self.__window, orient=HORIZONTAL),
                 {
-                    "x": DIMENSIONS["map"]["width"],
+                    "x": map_width,
                     "y": DIMENSIONS["hp_gauge"]["height"]
                     + DIMENSIONS["hp_gauge_bar"]["pady"],
                     "width": DIMENSIONS["side_bar"]["width"],
                 },
-            )
+            ),
         )
 
-        return separators
-
     def __show_separators(self):
         """Show the separator lines in the application master frame (intended
         to show up in the primary interface)."""
-        for separator_and_place_params in self.__separators:
-            separator, place_params = separator_and_place_params
+        for separator, place_params in self.__separators:
             separator.place(**place_params)
 
-    def __hide_separators(self):
-        """Hide the separator lines in the application master frame (intended
-        to show up in the primary interface)."""
-        for separator_and_place_params in self.__separators:
-            separator, _ = separator_and_place_params
-            separator.place_forget()
-
     @staticmethod
     def __configure_styles():
         """Loop over the themed-tk (ttk) styles defined in the view config and
         make sure they're registered in ttk's style namespace."""
+        # NOTE: All Style objects share the same underlying ttk style
+        # database, so a single one suffices for registering every style
+        ttk_style = Style()
         for style in STYLES.values():
-            Style().configure(**style)
+            ttk_style.configure(**style)
 
     def __configure_keystroke_capture(self):
         """Capture keystrokes so they can be sent to the controller for
         interpretation"""
+        # NOTE: Arrow keys are reported through this binding as well (with an
+        # empty char and their name as the keysym), so they need no bindings
+        # of their own
         self.__window.bind(
             "<KeyPress>", self.__forward_keystroke_to_controller
         )
-        # Also capture arrow keys
-        for arrow_key_event in {"<Left>", "<Right>", "<Up>", "<Down>"}:
-            self.__window.bind(
-                arrow_key_event,
-                self.__forward_keystroke_to_controller,
-            )
 
     def __create_main_menu(self):
         """Create a main menu widget, insert it into the application master
@@ -288,20 +402,17 @@ class TextTriviaMazeView(TriviaMazeView):
         return self.__main_menu.selected_option
 
     def hide_main_menu(self):
-        """Hide the main menu widget and show the primary interface
-        separators"""
+        """Hide the main menu widget to reveal the primary interface"""
         self.__main_menu.hide()
-        self.__show_separators()
 
     def show_main_menu(self):
-        """Show the main menu widget and hide the primary interface
-        separators"""
+        """Show the main menu widget on top of the primary interface"""
         self.__main_menu.show()
-        self.__hide_separators()
 
     def __create_in_game_menu(self):
         """Create the in-game menu widget, which is accessible to the user from
         the primary interface while they're actually playing the game."""
+        dims_title = DIMENSIONS["in_game_menu_title"]
         options = (
             "Back to Game",
             "Display Map Legend",
@@ -314,36 +425,52 @@ class TextTriviaMazeView(TriviaMazeView):
             self.__window,
             DIMENSIONS["in_game_menu"]["width"],
             "In-Game Menu",
-            DIMENSIONS["in_game_menu_title"]["padx"],
-            DIMENSIONS["in_game_menu_title"]["pady"],
+            dims_title["padx"],
+            dims_title["pady"],
             options,
         )
 
+    def __get_in_game_menu(self):
+        """Get the in-game menu, creating it the first time it is
+        needed."""
+        if self.__in_game_menu is None:
+            self.__in_game_menu = self.__create_in_game_menu()
+        return self.__in_game_menu
+
     def get_in_game_menu_current_selection(self):
         """Return the currently selected option in the in-game menu."""
-        return self.__in_game_menu.selected_option
+        return self.__get_in_game_menu().selected_option
 
     def show_in_game_menu(self):
         """Show the in-game menu."""
-        self.__in_game_menu.show()
+        self.__get_in_game_menu().show()
 
     def hide_in_game_menu(self):
         """Hide the in-game menu."""
-        self.__in_game_menu.hide()
+        if self.__in_game_menu is not None:
+            self.__in_game_menu.hide()
 
     def __create_short_QA_menu(self):
         """Create a generic question and answer widget that doesn't hold any
         content yet. Its content can be populated by the controller using the
         `set_short_QA_question` and `set_short_WA_hint` methods."""
+        dims = DIMENSIONS["question_and_answer_menu"]
         return ShortAnswerQuestionAndAnswer(
             self.__window,
             None,
-            DIMENSIONS["question_and_answer_menu"]["wraplength"],
+            dims["wraplength"],
             "Short Question & Answer",
-            DIMENSIONS["question_and_answer_menu"]["padx"],
-            DIMENSIONS["question_and_answer_menu"]["ipady"],
+            dims["padx"],
+            dims["ipady"],
         )
 
+    def __get_short_QA_menu(self):
+        """Get the short answer Q&A widget, creating it the first time it is
+        needed."""
+        if self.__short_QA_menu is None:
+            self.__short_QA_menu = self.__create_short_QA_menu()
+        return self.__short_QA_menu
+
     def set_short_QA_question(self, question_text):
         """Populate the short answer question and answer widget with the
         specified question contents.
@@ -353,7 +480,7 @@ class TextTriviaMazeView(TriviaMazeView):
         question_text : str
             Text to set question content to.
         """
-        self.__short_QA_menu.set_question(question_text)
+        self.__get_short_QA_menu().set_question(question_text)
 
     def set_short_QA_hint(self, hint_text):
         """Fill in the hint portion of the short question and answer widget
@@ -364,15 +491,16 @@ class TextTriviaMazeView(TriviaMazeView):
         hint_text : str
             Text to set the hint content to.
         """
-        self.__short_QA_menu.set_hint(hint_text)
+        self.__get_short_QA_menu().set_hint(hint_text)
 
     def show_short_QA_menu(self):
         """Show the question and answer widget."""
-        self.__short_QA_menu.show()
+        self.__get_short_QA_menu().show()
 
     def hide_short_QA_menu(self):
         """Hide the question and answer widget."""
-        self.__short_QA_menu.hide()
+        if self.__short_QA_menu is not None:
+            self.__short_QA_menu.hide()
 
     def get_short_QA_user_answer(self):
         """Return the user's current answer to the relevant Q&A prompt.
@@ -382,27 +510,37 @@ class TextTriviaMazeView(TriviaMazeView):
         str
             The user's answer in the free form entry box.
         """
-        return self.__short_QA_menu.get_user_answer()
+        return self.__get_short_QA_menu().get_user_answer()
 
     def clear_short_QA_user_answer(self):
         """Clear the contents of the text entry box in the short answer Q&A
         widget."""
-        return self.__short_QA_menu.clear_user_answer()
+        self.__get_short_QA_menu().clear_user_answer()
 
     def __create_multiple_choice_QA_menu(self):
         """Create a generic question and answer widget that doesn't hold any
         content yet. Its content can be populated by the controller using the
         `set_multiple_choice_QA_question` and `set_multiple_choice_WA_hint` methods.
         """
+        dims = DIMENSIONS["question_and_answer_menu"]
         return MultipleChoiceQuestionAndAnswerMenu(
             self.__window,
             None,
-            DIMENSIONS["question_and_answer_menu"]["wraplength"],
+            dims["wraplength"],
             "Short Question & Answer",
-            DIMENSIONS["question_and_answer_menu"]["padx"],
-            DIMENSIONS["question_and_answer_menu"]["ipady"],
+            dims["padx"],
+            dims["ipady"],
         )
 
+    def __get_multiple_choice_QA_menu(self):
+        """Get the multiple choice Q&A widget, creating it the first time it is
+        needed."""
+        if self.__multiple_choice_QA_menu is None:
+            self.__multiple_choice_QA_menu = (
+                self.__create_multiple_choice_QA_menu()
+            )
+        return self.__multiple_choice_QA_menu
+
     def set_multiple_choice_QA_question(self, question_text):
         """Populate the multiple_choice answer question and answer widget with the
         question contents.
@@ -412,7 +550,7 @@ class TextTriviaMazeView(TriviaMazeView):
         question_text : str
             Question contents.
         """
-        self.__multiple_choice_QA_menu.set_question(question_text)
+        self.__get_multiple_choice_QA_menu().set_question(question_text)
 
     def set_multiple_choice_QA_hint(self, hint_text):
         """Fill in the hint portion of the multiple_choice question and answer widget
@@ -423,25 +561,26 @@ class TextTriviaMazeView(TriviaMazeView):
         hint_text : str
             Hint contents.
         """
-        self.__multiple_choice_QA_menu.set_hint(hint_text)
+        self.__get_multiple_choice_QA_menu().set_hint(hint_text)
 
     def set_multiple_choice_QA_options(self, options):
         """Sets the options for selection to those in ``options``.
 
         Parameters
         ----------
-        options : List
-            List of strings comprising selection options.
+        options : Sequence
+            Sequence of strings comprising selection options.
         """
-        return self.__multiple_choice_QA_menu.set_options(options)
+        self.__get_multiple_choice_QA_menu().set_options(options)
 
     def show_multiple_choice_QA_menu(self):
         """Show the question and answer widget."""
-        self.__multiple_choice_QA_menu.show()
+        self.__get_multiple_choice_QA_menu().show()
 
     def hide_multiple_choice_QA_menu(self):
         """Hide the question and answer widget."""
-        self.__multiple_choice_QA_menu.hide()
+        if self.__multiple_choice_QA_menu is not None:
+            self.__multiple_choice_QA_menu.hide()
 
     def get_multiple_choice_QA_user_answer(self):
         """Return the user's current answer to the relevant Q&A prompt.
@@ -451,12 +590,12 @@ class TextTriviaMazeView(TriviaMazeView):
         str
             The current answer selected by the user, expressed as a string.
         """
-        return self.__multiple_choice_QA_menu.get_user_answer()
+        return self.__get_multiple_choice_QA_menu().get_user_answer()
 
     def clear_multiple_choice_QA_user_answer(self):
         """Clear the contents of the text entry box in the short answer Q&A
         widget."""
-        return self.__multiple_choice_QA_menu.clear_selection()
+        self.__get_multiple_choice_QA_menu().clear_selection()
 
     def select_multiple_choice_QA_user_answer(self, option_index):
         """Select the option in the multiple choice QA widget with the text
@@ -468,7 +607,7 @@ class TextTriviaMazeView(TriviaMazeView):
             Index associated with desired option. Indices are zero-based and go
             left-to-right, top-to-bottom.
         """
-        self.__multiple_choice_QA_menu.select_user_option(option_index)
+        self.__get_multiple_choice_QA_menu().select_user_option(option_index)
 
     def __create_true_or_false_QA_menu(self):
         """Create a generic T/F question and answer widget that doesn't hold
@@ -476,15 +615,25 @@ class TextTriviaMazeView(TriviaMazeView):
         `set_true_or_false_QA_question` and `set_true_or_false_WA_hint`
         methods.
         """
+        dims = DIMENSIONS["question_and_answer_menu"]
         return TrueFalseQuestionAndAnswerMenu(
             self.__window,
             None,
-            DIMENSIONS["question_and_answer_menu"]["wraplength"],
+            dims["wraplength"],
             "True/False Question & Answer",
-            DIMENSIONS["question_and_answer_menu"]["padx"],
-            DIMENSIONS["question_and_answer_menu"]["ipady"],
+            dims["padx"],
+            dims["ipady"],
         )
 
+    def __get_true_or_false_QA_menu(self):
+        """Get the true or false Q&A widget, creating it the first time it is
+        needed."""
+        if self.__true_or_false_QA_menu is None:
+            self.__true_or_false_QA_menu = (
+                self.__create_true_or_false_QA_menu()
+            )
+        return self.__true_or_false_QA_menu
+
     def set_true_or_false_QA_question(self, question_text):
         """Populate the true or false question and answer widget with the
         question contents.
@@ -494,7 +643,7 @@ class TextTriviaMazeView(TriviaMazeView):
         question_text : str
             Question contents.
         """
-        self.__true_or_false_QA_menu.set_question(question_text)
+        self.__get_true_or_false_QA_menu().set_question(question_text)
 
     def set_true_or_false_QA_options(self, options):
         """Populate the true or false question and answer widget with the
@@ -502,15 +651,15 @@ class TextTriviaMazeView(TriviaMazeView):
 
         Parameters
         ----------
-        options : List
-            List of strings to fill in as options.
+        options : Sequence
+            Sequence of strings to fill in as options.
         """
-        self.__true_or_false_QA_menu.set_options(options)
+        self.__get_true_or_false_QA_menu().set_options(options)
 
     def clear_true_or_false_QA_user_answer(self):
         """Clear the contents of the text entry box in the short answer Q&A
         widget."""
-        return self.__true_or_false_QA_menu.clear_selection()
+        self.__get_true_or_false_QA_menu().clear_selection()
 
     def select_true_or_false_QA_user_answer(self, option_index):
         """Select the option in the true of false QA widget with the text value
@@ -522,15 +671,16 @@ class TextTriviaMazeView(TriviaMazeView):
             Index associated with desired option. Indices are zero-based and go
             left-to-right, top-to-bottom.
         """
-        self.__true_or_false_QA_menu.select_user_option(option_index)
+        self.__get_true_or_false_QA_menu().select_user_option(option_index)
 
     def show_true_or_false_QA_menu(self):
         """Show the question and answer widget."""
-        self.__true_or_false_QA_menu.show()
+        self.__get_true_or_false_QA_menu().show()
 
     def hide_true_or_false_QA_menu(self):
         """Hide the question and answer widget."""
-        self.__true_or_false_QA_menu.hide()
+        if self.__true_or_false_QA_menu is not None:
+            self.__true_or_false_QA_menu.hide()
 
     def get_true_or_false_QA_user_answer(self):
         """Return the user's current answer to the relevant Q&A prompt.
@@ -541,238 +691,256 @@ class TextTriviaMazeView(TriviaMazeView):
             The current answer selected by the user (true or false), expressed
             as a string.
         """
-        return self.__true_or_false_QA_menu.get_user_answer()
+        return self.__get_true_or_false_QA_menu().get_user_answer()
 
     def __create_no_save_file_found_menu(self):
         """Create pop-up that tells the user that they couldn't load a game
         because no save file could be found."""
-        dismiss_message = (
-            f"Press {' or '.join(self.__dismiss_keys)} to return to the main "
-            "menu"
-        )
+        dims = DIMENSIONS["no_save_file_found_menu"]
+        dismiss_message = self.__dismiss_to_main_menu_message
         return DismissiblePopUp(
             self.__window,
             None,
-            textwrap.dedent(MESSAGES["no_save_file_found_menu"]),
+            MESSAGES["no_save_file_found_menu"],
             dismiss_message,
-            DIMENSIONS["no_save_file_found_menu"]["ipadx"],
-            DIMENSIONS["no_save_file_found_menu"]["ipady"],
-            STYLES["dismiss_text"]["style"],
-            STYLES["dismiss_bottom_label"]["style"],
+            dims["ipadx"],
+            dims["ipady"],
+            self.__DISMISS_TEXT_STYLE,
+            self.__DISMISS_BOTTOM_LABEL_STYLE,
         )
 
     def show_no_save_file_found_menu(self):
         """Show the pop-up telling the user that they can't load a game because
         no save file was found."""
+        if self.__no_save_file_found_menu is None:
+            self.__no_save_file_found_menu = (
+                self.__create_no_save_file_found_menu()
+            )
         self.__no_save_file_found_menu.show()
 
     def hide_no_save_file_found_menu(self):
         """Hide the pop-up telling the user that they can't load a game because
         no save file was found."""
-        self.__no_save_file_found_menu.hide()
+        if self.__no_save_file_found_menu is not None:
+            self.__no_save_file_found_menu.hide()
 
     def __create_save_confirmation_menu(self):
         """Create pop-up that tells the user that their save game was
         successful."""
-        dismiss_message = (
-            f"Press {' or '.join(self.__dismiss_keys)} to return to the "
-            "in-game menu"
-        )
+        dims = DIMENSIONS["save_confirmation_menu"]
+        dismiss_message = self.__dismiss_to_in_game_menu_message
         return DismissiblePopUp(
             self.__window,
             None,
-            textwrap.dedent(MESSAGES["save_confirmation_menu"]),
+            MESSAGES["save_confirmation_menu"],
             dismiss_message,
-            DIMENSIONS["save_confirmation_menu"]["ipadx"],
-            DIMENSIONS["save_confirmation_menu"]["ipady"],
-            STYLES["dismiss_text"]["style"],
-            STYLES["dismiss_bottom_label"]["style"],
+            dims["ipadx"],
+            dims["ipady"],
+            self.__DISMISS_TEXT_STYLE,
+            self.__DISMISS_BOTTOM_LABEL_STYLE,
         )
 
     def show_save_confirmation_menu(self):
         """Show the pop-up that tells the user their save game was
         successful."""
+        if self.__save_confirmation_menu is None:
+            self.__save_confirmation_menu = (
+                self.__create_save_confirmation_menu()
+            )
         self.__save_confirmation_menu.show()
 
     def hide_save_confirmation_menu(self):
         """Hide the pop-up that tells the user their save game was
         successful."""
-        self.__save_confirmation_menu.hide()
+        if self.__save_confirmation_menu is not None:
+            self.__save_confirmation_menu.hide()
 
     def __create_main_help_menu(self):
         """Create the main help menu. This is the help menu that is accessed
         from the main menu."""
-        dismiss_message = (
-            f"Press {' or '.join(self.__dismiss_keys)} to return to the main "
-            "menu"
-        )
+        dims = DIMENSIONS["main_help_menu"]
+        dismiss_message = self.__dismiss_to_main_menu_message
         return DismissiblePopUp(
             self.__window,
             None,
-            textwrap.dedent(MESSAGES["main_help_menu"]),
+            MESSAGES["main_help_menu"],
             dismiss_message,
-            DIMENSIONS["main_help_menu"]["ipadx"],
-            DIMENSIONS["main_help_menu"]["ipady"],
-            STYLES["dismiss_text"]["style"],
-            STYLES["dismiss_bottom_label"]["style"],
+            dims["ipadx"],
+            dims["ipady"],
+            self.__DISMISS_TEXT_STYLE,
+            self.__DISMISS_BOTTOM_LABEL_STYLE,
         )
 
     def show_main_help_menu(self):
         """Show the main help menu."""
+        if self.__main_help_menu is None:
+            self.__main_help_menu = self.__create_main_help_menu()
         self.__main_help_menu.show()
 
     def hide_main_help_menu(self):
         """Hide the main help menu."""
-        self.__main_help_menu.hide()
+        if self.__main_help_menu is not None:
+            self.__main_help_menu.hide()
 
     def __create_need_magic_key_menu(self):
         """Create the widget for when the player tries to pass through a
         permanently locked door and do not hold any magic keys. It tells them
         they need to find a magic key if they want to unlock the door."""
-        dismiss_message = (
-            f"Press {' or '.join(self.__dismiss_keys)} to return to the game"
-        )
+        dims = DIMENSIONS["need_magic_key_menu"]
+        dismiss_message = self.__dismiss_to_game_message
         return DismissiblePopUp(
             self.__window,
             None,
-            textwrap.dedent(MESSAGES["need_magic_key_menu"]),
+            MESSAGES["need_magic_key_menu"],
             dismiss_message,
-            DIMENSIONS["need_magic_key_menu"]["ipadx"],
-            DIMENSIONS["need_magic_key_menu"]["ipady"],
-            STYLES["dismiss_text"]["style"],
-            STYLES["dismiss_bottom_label"]["style"],
+            dims["ipadx"],
+            dims["ipady"],
+            self.__DISMISS_TEXT_STYLE,
+            self.__DISMISS_BOTTOM_LABEL_STYLE,
         )
 
     def show_need_magic_key_menu(self):
         """Show the widget that tells the player they need a magic key to
         unlock a permanently locked door."""
+        if self.__need_magic_key_menu is None:
+            self.__need_magic_key_menu = self.__create_need_magic_key_menu()
         self.__need_magic_key_menu.show()
 
     def hide_need_magic_key_menu(self):
         """Hide the widget that tells the player they need a magic key to
         unlock a permanently locked door."""
-        self.__need_magic_key_menu.hide()
+        if self.__need_magic_key_menu is not None:
+            self.__need_magic_key_menu.hide()
 
     def __create_magic_key_menu(self):
         """Create the widget for when the player tries to pass through a
         permanently locked door and holds a magic key. It asks them if they
         would like to use a magic key or not."""
+        dims = DIMENSIONS["magic_key_menu"]
         dismiss_message = "Press 'y' to use a magic key if not press 'n'"
         return DismissiblePopUp(
             self.__window,
             None,
-            textwrap.dedent(MESSAGES["use_magic_key_menu"]),
+            MESSAGES["use_magic_key_menu"],
             dismiss_message,
-            DIMENSIONS["magic_key_menu"]["ipadx"],
-            DIMENSIONS["magic_key_menu"]["ipady"],
-            STYLES["dismiss_text"]["style"],
-            STYLES["dismiss_bottom_label"]["style"],
+            dims["ipadx"],
+            dims["ipady"],
+            self.__DISMISS_TEXT_STYLE,
+            self.__DISMISS_BOTTOM_LABEL_STYLE,
         )
 
     def show_magic_key_menu(self):
         """Show the widget that tells the player they can use a magic key to
         unlock a permanently locked door."""
+        if self.__magic_key_menu is None:
+            self.__magic_key_menu = self.__create_magic_key_menu()
         self.__magic_key_menu.show()
 
     def hide_magic_key_menu(self):
         """Hide the widget that tells the player they can use a magic key to
         unlock a permanently locked door."""
-        self.__magic_key_menu.hide()
+        if self.__magic_key_menu is not None:
+            self.__magic_key_menu.hide()
 
     def __create_game_won_menu(self):
         """Create the widget telling the player they won the game."""
-        dismiss_message = (
-            f"Press {' or '.join(self.__dismiss_keys)} to return to the main "
-            "menu"
-        )
+        dims = DIMENSIONS["game_won_menu"]
+        dismiss_message = self.__dismiss_to_main_menu_message
         return DismissiblePopUp(
             self.__window,
             None,
-            textwrap.dedent(MESSAGES["game_won_menu"]),
+            MESSAGES["game_won_menu"],
             dismiss_message,
-            DIMENSIONS["game_won_menu"]["ipadx"],
-            DIMENSIONS["game_won_menu"]["ipady"],
-            STYLES["dismiss_text"]["style"],
-            STYLES["dismiss_bottom_label"]["style"],
+            dims["ipadx"],
+            dims["ipady"],
+            self.__DISMISS_TEXT_STYLE,
+            self.__DISMISS_BOTTOM_LABEL_STYLE,
         )
 
     def show_game_won_menu(self):
         """Show the widget telling the player they won the game."""
+        if self.__game_won_menu is None:
+            self.__game_won_menu = self.__create_game_won_menu()
         self.__game_won_menu.show()
 
     def hide_game_won_menu(self):
         """Hide the widget telling the player they won the game."""
-        self.__game_won_menu.hide()
+        if self.__game_won_menu is not None:
+            self.__game_won_menu.hide()
 
     def __create_game_lost_died_menu(self):
         """Create the widget telling the player they lost the game
         from the adventurer reaching 0 hitpoints."""
-        dismiss_message = (
-            f"Press {' or '.join(self.__dismiss_keys)} to return to the main "
-            "menu"
-        )
+        dims = DIMENSIONS["game_lost_died_menu"]
+        dismiss_message = self.__dismiss_to_main_menu_message
         return DismissiblePopUp(
             self.__window,
             None,
-            textwrap.dedent(MESSAGES["game_lost_died_menu"]),
+            MESSAGES["game_lost_died_menu"],
             dismiss_message,
-            DIMENSIONS["game_lost_died_menu"]["ipadx"],
-            DIMENSIONS["game_lost_died_menu"]["ipady"],
-            STYLES["dismiss_text"]["style"],
-            STYLES["dismiss_bottom_label"]["style"],
+            dims["ipadx"],
+            dims["ipady"],
+            self.__DISMISS_TEXT_STYLE,
+            self.__DISMISS_BOTTOM_LABEL_STYLE,
         )
 
     def show_game_lost_died_menu(self):
         """Show the widget telling the player they lost the game."""
+        if self.__game_lost_died_menu is None:
+            self.__game_lost_died_menu = self.__create_game_lost_died_menu()
         self.__game_lost_died_menu.show()
 
     def hide_game_lost_died_menu(self):
         """Hide the widget telling the player they lost the game."""
-        self.__game_lost_died_menu.hide()
+        if self.__game_lost_died_menu is not None:
+            self.__game_lost_died_menu.hide()
 
     def __create_game_lost_trapped_menu(self):
         """Create the widget telling the player they lost the game by
         getting trapped in the maze."""
-        dismiss_message = (
-            f"Press {' or '.join(self.__dismiss_keys)} to return to the main "
-            "menu"
-        )
+        dims = DIMENSIONS["game_lost_trapped_menu"]
+        dismiss_message = self.__dismiss_to_main_menu_message
         return DismissiblePopUp(
             self.__window,
             None,
-            textwrap.dedent(MESSAGES["game_lost_trapped_menu"]),
+            MESSAGES["game_lost_trapped_menu"],
             dismiss_message,
-            DIMENSIONS["game_lost_trapped_menu"]["ipadx"],
-            DIMENSIONS["game_lost_trapped_menu"]["ipady"],
-            STYLES["dismiss_text"]["style"],
-            STYLES["dismiss_bottom_label"]["style"],
+            dims["ipadx"],
+            dims["ipady"],
+            self.__DISMISS_TEXT_STYLE,
+            self.__DISMISS_BOTTOM_LABEL_STYLE,
         )
 
     def show_game_lost_trapped_menu(self):
         """Show the widget telling the player they lost the game
         from getting trapped."""
+        if self.__game_lost_trapped_menu is None:
+            self.__game_lost_trapped_menu = (
+                self.__create_game_lost_trapped_menu()
+            )
         self.__game_lost_trapped_menu.show()
 
     def hide_game_lost_trapped_menu(self):
         """Hide the widget telling the player they lost the game
         from getting trapped."""
-        self.__game_lost_trapped_menu.hide()
+        if self.__game_lost_trapped_menu is not None:
+            self.__game_lost_trapped_menu.hide()
 
     def __forward_keystroke_to_controller(self, event):
         """Given a tkinter event, attempt to map it to a corresponding
         keystroke and pass it to the controller for interpretation as a
         command."""
-        NEWLINE = 13
-        ESCAPE = 27
-        LINEFEED = 10
-
         # For regular keys
         key = event.char
 
         # If char was empty, check to see if it was an arrow key
-        if not key or event.keycode in (NEWLINE, ESCAPE, LINEFEED):
+        if not key or event.keycode in self.__KEYSYM_KEYCODES:
             key = event.keysym
 
+            # Don't bother the controller with lone modifier keys
+            if key in self.__IGNORED_KEYSYMS:
+                return
+
         if key:
             # If keysym wasn't empty, forward it to controller. Otherwise, just
             # ignore it since it's not a supported key command.
@@ -844,19 +1012,20 @@ class TextTriviaMazeView(TriviaMazeView):
             item_labels=self.__PILLAR_TYPE_LABELS.values(),
         )
 
+        dims_menu_access_label = DIMENSIONS["menu_access_label"]
         menu_access_label = Label(
             master=side_bar.frame,
             text="",
             justify=CENTER,
             anchor=CENTER,
             style=STYLES["menu_access_label"]["style"],
-            wraplength=DIMENSIONS["side_bar"]["width"]
-            - DIMENSIONS["menu_access_label"]["ipadx"],
+            wraplength=dims_side_bar["width"]
+            - dims_menu_access_label["ipadx"],
         )
         menu_access_label.pack(
             side=BOTTOM,
-            ipadx=DIMENSIONS["menu_access_label"]["ipadx"],
-            ipady=DIMENSIONS["menu_access_label"]["ipady"],
+            ipadx=dims_menu_access_label["ipadx"],
+            ipady=dims_menu_access_label["ipady"],
         )
         return hp_gauge, inventory, pillars_inventory, menu_access_label
 
@@ -886,174 +1055,65 @@ class TextTriviaMazeView(TriviaMazeView):
             How many columns of symbol-description pairs should be constructed
             in the map legend.
         """
-        symbols = []
-        descriptions = []
-        for _, entry in ROOM_CONTENT_SYMBOLS.items():
-            symbols.append(entry[ROOM_CONTENT_SYMBOL_KEY])
-            descriptions.append(entry[ROOM_CONTENT_DESC_KEY])
-
-        symbol_overrides = {" ": "<space>"}
-        legend_rows = self.__generate_rows_for_multicolumn_display(
+        dims = DIMENSIONS["map_legend_menu"]
+        symbols = tuple(
+            entry[ROOM_CONTENT_SYMBOL_KEY]
+            for entry in ROOM_CONTENT_SYMBOLS.values()
+        )
+        descriptions = tuple(
+            entry[ROOM_CONTENT_DESC_KEY]
+            for entry in ROOM_CONTENT_SYMBOLS.values()
+        )
+
+        symbol_overrides = frozenset({" ": "<space>"}.items())
+        legend_text = _generate_multicolumn_display_text(
             symbols=symbols,
             descriptions=descriptions,
             num_cols=num_cols,
             symbol_overrides=symbol_overrides,
         )
 
-        dismiss_message = (
-            f"Press {' or '.join(self.__dismiss_keys)} to return to the "
-            "in-game menu"
-        )
+        dismiss_message = self.__dismiss_to_in_game_menu_message
         return DismissiblePopUp(
             self.__window,
             None,
-            ("\n").join(legend_rows),
+            legend_text,
             dismiss_message,
-            DIMENSIONS["map_legend_menu"]["ipadx"],
-            DIMENSIONS["map_legend_menu"]["ipady"],
-            STYLES["dismiss_text"]["style"],
-            STYLES["dismiss_bottom_label"]["style"],
+            dims["ipadx"],
+            dims["ipady"],
+            self.__DISMISS_TEXT_STYLE,
+            self.__DISMISS_BOTTOM_LABEL_STYLE,
         )
 
-    @staticmethod
-    def __generate_rows_for_multicolumn_display(
-        symbols, descriptions, num_cols, symbol_overrides
-    ):
-        """Given a set of symbols and descriptions for a legend, pack them into
-        a specified number of formatted columns so that they can be displayed
-        as a giant string. Symbols can be overridden using a dictionary
-        parameter.
-
-        Parameters
-        ----------
-        symbols : list
-            Abbreviated symbols that need descriptions.
-        descriptions : list
-            Description that explain the abbreviated symbols.
-        num_cols : int
-            How many columns of symbol-description pairs should be constructed
-            in the display.
-        symbol_overrides : dict
-            Maps strings in ``symbols`` to strings that should be written into
-            the display instead, e.g. an space doesn't display well so we
-            replace it with "<space>".
-
-        Returns
-        -------
-        list
-            The individual rows of text that make up the display content. These
-            will typically be joined by newlines by the caller to come up with
-            the final display string.
-        """
-        # Separation to place between columns
-        COL_SEP = "  "
-        SYMBOL_DESC_SEP = ": "
-
-        # Initialize 2D array that will contain some number of display rows
-        # (depending on the length of symbols and descriptions), each of which
-        # will contain 2*num_cols entries corresponding to the symbol and
-        # description of each column.
-        rows = []
-        row = -1
-        col = 0
-        for symbol, description in zip(symbols, descriptions):
-            if symbol in symbol_overrides:
-                symbol = symbol_overrides[symbol]
-
-            if col == 0:
-                # Begin list for this row
-                rows.append([])
-                row += 1
-
-            rows[row].append([symbol, description])
-
-            col += 1
-
-            if col == num_cols:
-                # Reset column counter
-                col = 0
-
-        # Find the longest symbol string in each symbol subcolumn
-        symbol_max_len_by_col = []
-        description_max_len_by_col = []
-
-        # Maximum possible width of a given row of chars
-        total_width = len(COL_SEP) * (num_cols - 1)
-
-        for col in range(num_cols):
-            # For this column, assemble all symbols for it by looping over all
-            # of the rows
-            symbols_in_col = []
-            descriptions_in_col = []
-            for row in rows:
-                # If this row doesn't have an entry for all columns, append
-                # empty string entries.
-                if col >= len(row):
-                    symbols_in_col.append("")
-                    descriptions_in_col.append("")
-                else:
-                    symbols_in_col.append(row[col][0])
-                    descriptions_in_col.append(row[col][1])
-
-            symbol_max_len_in_this_col = len(max(symbols_in_col, key=len))
-            description_max_len_in_this_col = len(
-                max(descriptions_in_col, key=len)
-            )
-            description_max_len_by_col.append(description_max_len_in_this_col)
-            symbol_max_len_by_col.append(symbol_max_len_in_this_col)
-
-            total_width += (
-                symbol_max_len_in_this_col
-                + len(SYMBOL_DESC_SEP)
-                + description_max_len_in_this_col
-            )
-
-        row_entries = []
-        for row in rows:
-            row_str = ""
-            for col, (symbol, description) in enumerate(row):
-                row_str += (
-                    f"{symbol:>{symbol_max_len_by_col[col]}}{SYMBOL_DESC_SEP}"
-                    f"{description:<{description_max_len_by_col[col]}}"
-                )
-                if col < len(row) - 1:
-                    row_str += COL_SEP
-
-            row_entries.append(row_str)
-
-        # Pad the bottom row to the right with spaces
-        row_entries[-1] = row_entries[-1].ljust(total_width)
-
-        return row_entries
-
     def show_map_legend_menu(self):
         """Show the widget that can be accessed from the in-game menu to
         display the legend of symbols used in the map."""
+        if self.__map_legend_menu is None:
+            self.__map_legend_menu = self.__create_map_legend_menu()
         self.__map_legend_menu.show()
 
     def hide_map_legend_menu(self):
         """Hide the widget that can be accessed from the in-game menu to
         display the legend of symbols used in the map."""
-        self.__map_legend_menu.hide()
+        if self.__map_legend_menu is not None:
+            self.__map_legend_menu.hide()
 
     def __create_command_legend_menu(self):
         """Create the widget that can be accessed from the in-game menu to
         display the commands accessible in the primary interface. Note that the
         contents are initially empty, and are set via arguments passed to the
         `show_commands_legend_menu()` method."""
-        dismiss_message = (
-            f"Press {' or '.join(self.__dismiss_keys)} to return to the "
-            "in-game menu"
-        )
+        dims = DIMENSIONS["command_legend_menu"]
+        dismiss_message = self.__dismiss_to_in_game_menu_message
         return DismissiblePopUp(
             self.__window,
             None,
             None,
             dismiss_message,
-            DIMENSIONS["command_legend_menu"]["ipadx"],
-            DIMENSIONS["command_legend_menu"]["ipady"],
-            STYLES["dismiss_text"]["style"],
-            STYLES["dismiss_bottom_label"]["style"],
+            dims["ipadx"],
+            dims["ipady"],
+            self.__DISMISS_TEXT_STYLE,
+            self.__DISMISS_BOTTOM_LABEL_STYLE,
         )
 
     def show_command_legend_menu(self, symbols, descriptions, num_cols):
@@ -1071,20 +1131,23 @@ class TextTriviaMazeView(TriviaMazeView):
             How many columns of symbol-description pairs should be constructed
             in the command legend.
         """
-        legend_rows = self.__generate_rows_for_multicolumn_display(
-            symbols=symbols,
-            descriptions=descriptions,
+        legend_text = _generate_multicolumn_display_text(
+            symbols=tuple(symbols),
+            descriptions=tuple(descriptions),
             num_cols=num_cols,
-            symbol_overrides={},
+            symbol_overrides=frozenset(),
         )
 
-        self.__command_legend_menu.set_text(("\n").join(legend_rows))
+        if self.__command_legend_menu is None:
+            self.__command_legend_menu = self.__create_command_legend_menu()
+        self.__command_legend_menu.set_text(legend_text)
         self.__command_legend_menu.show()
 
     def hide_command_legend_menu(self):
         """Hide the widget that can be accessed from the in-game menu to
         display the commands accessible in the primary interface."""
-        self.__command_legend_menu.hide()
+        if self.__command_legend_menu is not None:
+            self.__command_legend_menu.hide()
 
     def __create_event_log(self):
         """Create the event log widget, which is used to record log messages
@@ -1113,7 +1176,28 @@ class TextTriviaMazeView(TriviaMazeView):
         """
         self.__event_log.write(message)
 
+    def write_many_to_event_log(self, messages):
+        """Write several messages, each on a new line, in the event log
+        widget.
+
+        Parameters
+        ----------
+        messages : Sequence[str]
+            Texts to write into the chat log, in order.
+        """
+        self.__event_log.write_many(messages)
+
     def update(self):
+        # Model updates that arrive in quick succession (e.g. several moves
+        # before Tk gets a chance to redraw) are coalesced into a single
+        # refresh once Tk is idle
+        if self.__refresh_id is None and not self.__window_destroyed:
+            self.__refresh_id = self.__window.after_idle(self.__refresh)
+
+    def __refresh(self):
+        """Bring the primary interface up to date with the model."""
+        self.__refresh_id = None
+
         # Update map
         self.__update_map()
 
@@ -1121,8 +1205,7 @@ class TextTriviaMazeView(TriviaMazeView):
         self.__hp_gauge.set(self._maze_model.get_adventurer_hp())
 
         # Grab event log entries and write them out
-        for log_message in self._maze_model.flush_event_log_buffer():
-            self.write_to_event_log(log_message)
+        self.write_many_to_event_log(self._maze_model.flush_event_log_buffer())
 
         # Update inventories
         self.__update_inventories()
@@ -1136,18 +1219,18 @@ class TextTriviaMazeView(TriviaMazeView):
 
     def __update_inventory(self, current_items):
         """Update the counts of all items in the enumerated inventory."""
-        for item_type, item_label in self.__INVENTORY_TYPE_LABELS.items():
+        for item_index, item_type in enumerate(self.__INVENTORY_TYPE_LABELS):
             item_count = sum(
                 isinstance(item, item_type) for item in current_items
             )
-            self.__inventory.update_item_quantity(item_label, item_count)
+            self.__inventory.update_item_quantity(item_index, item_count)
 
     def __update_pillar_inventory(self, current_items):
         """Check any boxes in the pillar inventory if the adventurer holds the
         relevant pillar."""
-        for pillar_type, pillar_label in self.__PILLAR_TYPE_LABELS.items():
+        for pillar_index, pillar_type in enumerate(self.__PILLAR_TYPE_LABELS):
             if any((isinstance(item, pillar_type) for item in current_items)):
-                self.__pillars_inventory.check_item(pillar_label)
+                self.__pillars_inventory.check_item(pillar_index)
 
     def reset_inventories(self):
         """Set all inventory quantities to zero and uncheck all pillar
@@ -1161,6 +1244,17 @@ class TextTriviaMazeView(TriviaMazeView):
 
     def quit_entire_game(self):
         """Tear down the entire application and quit."""
+        if self.__window_destroyed:
+            return
+
+        # Drop any refresh or event log writes that are still scheduled, since
+        # there will be nothing left for them to draw on
+        if self.__refresh_id is not None:
+            self.__window.after_cancel(self.__refresh_id)
+            self.__refresh_id = None
+        self.__event_log.discard_pending_writes()
+
+        self.__window_destroyed = True
         self.__window.destroy()
 
     def __create_difficulty_menu(self):
@@ -1175,14 +1269,22 @@ class TextTriviaMazeView(TriviaMazeView):
             self.__window, MESSAGES["difficulty_choice_menu"], options
         )
 
+    def __get_difficulty_menu(self):
+        """Get the difficulty menu, creating it the first time it is
+        needed."""
+        if self.__difficulty_menu is None:
+            self.__difficulty_menu = self.__create_difficulty_menu()
+        return self.__difficulty_menu
+
     def get_difficulty_menu_selection(self):
         """Return the currently selected option in the difficulty menu."""
-        return self.__difficulty_menu.selected_option
+        return self.__get_difficulty_menu().selected_option
 
     def show_difficulty_menu(self):
         """Shows the difficulty menu to select difficulty."""
-        return self.__difficulty_menu.show()
+        return self.__get_difficulty_menu().show()
 
     def hide_difficulty_menu(self):
         """Hides the difficulty menu after a choice has been made."""
-        return self.__difficulty_menu.hide()
+        if self.__difficulty_menu is not None:
+            self.__difficulty_menu.hide()
@@ -4,7 +4,6 @@ import pickle
 
 from adventurer import Adventurer
 from maze import Maze
-from maze_items import SuggestionPotion
 from room import Room
 from trivia_maze_model import TriviaMazeModel
 from trivia_database import SQLiteTriviaDatabase
@@ -268,6 +267,7 @@ class TriviaMaze(TriviaMazeModel):
             self.__question_and_answer_buffer.append(
                 door_or_wall.question_and_answer
             )
+            self.__notify_observers_of_question_and_answer()
 
         else:
             # Passable door -- either wasn't locked to begin with or was
@@ -425,15 +425,8 @@ class TriviaMaze(TriviaMazeModel):
                 )
 
         elif item == self.__ITEMS[self.__Items.SUGGESTION_POTION]:
-            # Use vision potion
-            adventurer_items = self.get_adventurer_items()
-
-            # If user has at least one suggestion potion, show hint box
-            num_suggestion_potions = sum(
-                isinstance(x, SuggestionPotion) for x in adventurer_items
-            )
-
-            if num_suggestion_potions > 0:
+            # Use suggestion potion
+            if self.get_num_suggestion_potions() > 0:
                 suggestion_potion = (
                     self.__adventurer.consume_suggestion_potion()
                 )
@@ -678,6 +671,10 @@ class TriviaMaze(TriviaMazeModel):
         for observer in self._maze_observers:
             observer.update()
 
+    def __notify_observers_of_question_and_answer(self):
+        for observer in self._maze_observers:
+            observer.on_question_and_answer_posted()
+
     def flush_event_log_buffer(self):
         """If there are any entries in the event log buffer, remove and return
         them.
@@ -687,20 +684,25 @@ class TriviaMaze(TriviaMazeModel):
         List[str]
             Messages to be displayed in the event log.
         """
-        log_contents = self.__event_log_buffer.copy()
-        self.__event_log_buffer.clear()
+        # Hand over the buffer itself and start a fresh one rather than
+        # copying its entries out
+        log_contents = self.__event_log_buffer
+        self.__event_log_buffer = []
         return log_contents
 
     def flush_question_and_answer_buffer(self):
-        """If a question is in the Q&A buffer, remove and return it.
+        """If there are any questions in the Q&A buffer, remove and return
+        them.
 
         Returns
         -------
-        QuestionAndAnswer
-            An object that can be used to pose a question to a user, possibly
-            give them a hint, and get an answer."""
-        if self.__question_and_answer_buffer:
-            return self.__question_and_answer_buffer.pop()
+        List[QuestionAndAnswer]
+            Objects that can be used to pose a question to a user, possibly
+            give them a hint, and get an answer, in the order they were
+            encountered."""
+        buffer_contents = self.__question_and_answer_buffer.copy()
+        self.__question_and_answer_buffer.clear()
+        return buffer_contents
 
     def get_adventurer_items(self):
         """Get a list of all items held by the adventurer.
@@ -711,3 +713,13 @@ class TriviaMaze(TriviaMazeModel):
             A list of all items currently held by the adventurer.
         """
         return self.__adventurer.get_items()
+
+    def get_num_suggestion_potions(self):
+        """Get the number of suggestion potions held by the adventurer.
+
+        Returns
+        -------
+        int
+            The number of suggestion potions the adventurer has.
+        """
+        return len(self.__adventurer.get_suggestion_potions())
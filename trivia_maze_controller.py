@@ -7,6 +7,8 @@ class TriviaMazeController(TriviaMazeModelObserver):
     """An agent that observes a maze model and controls it based on user input
     forwarded by the view."""
 
+    __slots__ = ()
+
     @abstractmethod
     def process_keystroke(self, key):
         """
@@ -90,6 +90,16 @@ class TriviaMazeModel(ABC):
             A list of all items currently held by the adventurer.
         """
 
+    @abstractmethod
+    def get_num_suggestion_potions(self):
+        """Get the number of suggestion potions held by the adventurer.
+
+        Returns
+        -------
+        int
+            The number of suggestion potions the adventurer has.
+        """
+
     @abstractmethod
     def move_adventurer(self, direction):
         """
@@ -127,13 +137,15 @@ class TriviaMazeModel(ABC):
 
     @abstractmethod
     def flush_question_and_answer_buffer(self):
-        """If a question is in the Q&A buffer, remove and return it.
+        """If there are any questions in the Q&A buffer, remove and return
+        them.
 
         Returns
         -------
-        QuestionAndAnswer
-            An object that can be used to pose a question to a user, possibly
-            give them a hint, and get an answer."""
+        List[QuestionAndAnswer]
+            Objects that can be used to pose a question to a user, possibly
+            give them a hint, and get an answer, in the order they were
+            encountered."""
 
     @abstractmethod
     def game_status(self):
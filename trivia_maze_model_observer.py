@@ -3,6 +3,8 @@ from trivia_maze import TriviaMaze
 
 
 class TriviaMazeModelObserver(ABC):
+    __slots__ = ("_maze_model",)
+
     def __init__(self, trivia_maze: TriviaMaze):
         """Bind given TriviaMaze to instance attr and register as an observer
         with it.
@@ -14,3 +16,8 @@ class TriviaMazeModelObserver(ABC):
     def update(self):
         """Perform any necessary updates to self whenever the maze model emits
         a notification."""
+
+    def on_question_and_answer_posted(self):
+        """Respond to the maze model putting a new Q&A in its Q&A buffer. This
+        is called before the accompanying call to `update`. Observers that do
+        not pose Q&As need not override it."""
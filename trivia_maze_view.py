@@ -301,6 +301,17 @@ class TriviaMazeView(TriviaMazeModelObserver):
             Text to write into the chat log.
         """
 
+    @abstractmethod
+    def write_many_to_event_log(self, messages):
+        """Write several messages, each on a new line, in the event log
+        widget.
+
+        Parameters
+        ----------
+        messages : Sequence[str]
+            Texts to write into the chat log, in order.
+        """
+
     @abstractmethod
     def clear_event_log(self):
         """Clear the contents of the event log."""
@@ -2,8 +2,34 @@ from abc import abstractmethod
 import functools
 import textwrap
 
-from tkinter import *
-from tkinter.ttk import *
+from tkinter import (
+    BOTH,
+    CENTER,
+    END,
+    HORIZONTAL,
+    LEFT,
+    NSEW,
+    RIDGE,
+    RIGHT,
+    SUNKEN,
+    TOP,
+    VERTICAL,
+    W,
+    Y,
+    IntVar,
+    Listbox,
+    TclError,
+    Text,
+)
+from tkinter.ttk import (
+    Checkbutton,
+    Entry,
+    Frame,
+    Label,
+    Progressbar,
+    Radiobutton,
+    Scrollbar,
+)
 
 from view_config import STYLES
 
@@ -77,8 +103,8 @@ class TextMenu:
     def __add_options(self):
         """Add the options supplied during initialization to the list of
         options in the menu."""
-        for ind, option in enumerate(self.__options):
-            self.__list_box.insert(ind + 1, option)
+        # Insert all options with a single call rather than one per option
+        self.__list_box.insert(END, *self.__options)
 
     def reset_selection(self):
         """Unselects all lines and sets the first item as active"""
@@ -199,14 +225,14 @@ class Map(SubWindow):
         self.__text = text
 
         # Create empty label that will hold the actual map
-        lbl = Label(
+        self.__label = Label(
             master=self.frame,
             text=text,
             style=STYLES["map"]["style"],
             justify=CENTER,
             anchor=CENTER,
         )
-        lbl.pack(padx=padx, fill=BOTH, expand=True)
+        self.__label.pack(padx=padx, fill=BOTH, expand=True)
 
     @property
     def contents(self):
@@ -216,8 +242,12 @@ class Map(SubWindow):
     @contents.setter
     def contents(self, text):
         """Used to set the text string underlying the maze map."""
+        # Leave the label alone if the map hasn't changed
+        if text == self.__text:
+            return
+
         self.__text = text
-        self.frame.children["!label"].configure(text=text)
+        self.__label.configure(text=text)
 
 
 class EventLog(SubWindow):
@@ -240,6 +270,17 @@ class EventLog(SubWindow):
     # String prefixed to all log entries
     __PREFIX = "> "
 
+    # Each buffered entry carries the newline that separates it from the entry
+    # before it
+    __ENTRY_START = "\n" + __PREFIX
+
+    # Messages written within this many milliseconds of one another are
+    # inserted into the text box together
+    __FLUSH_DELAY_MS = 16
+
+    # Oldest lines are discarded once the log grows past this many lines
+    __MAX_LINES = 500
+
     def __init__(
         self,
         window,
@@ -275,25 +316,67 @@ class EventLog(SubWindow):
 
         self.__contents_empty = True
 
+        # Messages waiting to be inserted into the text box and the id of the
+        # scheduled callback that will insert them, if any
+        self.__pending_messages = []
+        self.__flush_id = None
+
     def write(self, message):
-        """Write a message in a new line of the event log."""
+        """Write a message in a new line of the event log. The message is
+        buffered and inserted along with any others written shortly after
+        it."""
+        self.__pending_messages.append(self.__ENTRY_START + message)
+        self.__schedule_flush()
+
+    def write_many(self, messages):
+        """Write several messages, each in a new line of the event log. The
+        messages are buffered just like those passed to `write`."""
+        if not messages:
+            return
+
+        entry_start = self.__ENTRY_START
+        self.__pending_messages.extend(
+            entry_start + message for message in messages
+        )
+        self.__schedule_flush()
+
+    def __schedule_flush(self):
+        """Arrange for the buffered messages to be inserted shortly, unless
+        that has already been arranged."""
+        if self.__flush_id is None:
+            self.__flush_id = self.frame.after(
+                self.__FLUSH_DELAY_MS, self.__flush
+            )
+
+    def __flush(self):
+        """Insert all buffered messages into the text box at once."""
+        self.__flush_id = None
         event_log_text_box = self.__textbox
 
+        messages = "".join(self.__pending_messages)
+        self.__pending_messages.clear()
+
+        # The very first entry in the log has no entry before it to separate
+        # it from
         if self.__contents_empty:
-            message_wrapped = ""
-        else:
-            message_wrapped = "\n"
+            messages = messages[1:]
 
-        message_wrapped += self.__PREFIX + message
+        # Only follow new entries if the user hasn't scrolled up to read older
+        # ones
+        at_bottom = event_log_text_box.yview()[1] >= 1.0
 
-        # Make text box writable for a brief instant, write to it, then make it
-        # read-only again
-        event_log_text_box.config(state=NORMAL)
-        event_log_text_box.insert(END, message_wrapped)
-        event_log_text_box.config(state=DISABLED)
+        event_log_text_box.insert(END, messages)
+
+        # Discard the oldest lines if the log has grown too long
+        num_lines = int(event_log_text_box.index("end-1c").split(".")[0])
+        if num_lines > self.__MAX_LINES:
+            event_log_text_box.delete(
+                "1.0", f"{num_lines - self.__MAX_LINES + 1}.0"
+            )
 
         # Scroll down as far as possible
-        event_log_text_box.yview(END)
+        if at_bottom:
+            event_log_text_box.yview(END)
 
         self.__contents_empty = False
 
@@ -318,16 +401,28 @@ class EventLog(SubWindow):
         # done in this order)
         scrlbar.config(command=scrltxt.yview)
 
-        # Make text box read-only
-        scrltxt.config(state=DISABLED)
+        # Make text box read-only. It is left in the normal state so that it
+        # can be written to directly, but is kept from ever taking focus so
+        # that keystrokes meant for the window never reach it. Clicks and
+        # pastes, which could otherwise focus or edit it, are swallowed.
+        scrltxt.config(takefocus=0)
+        for sequence in ("<Button-1>", "<<Paste>>", "<<PasteSelection>>"):
+            scrltxt.bind(sequence, lambda event: "break")
 
         return scrltxt
 
+    def discard_pending_writes(self):
+        """Drop any messages that have been written but not yet inserted into
+        the text box."""
+        if self.__flush_id is not None:
+            self.frame.after_cancel(self.__flush_id)
+            self.__flush_id = None
+        self.__pending_messages.clear()
+
     def clear(self):
         """Clear contents of the event log."""
-        self.__textbox.config(state=NORMAL)
+        self.discard_pending_writes()
         self.__textbox.delete("1.0", END)
-        self.__textbox.config(state=DISABLED)
 
 
 class EnumeratedInventory:
@@ -364,10 +459,15 @@ class EnumeratedInventory:
 
         self.__item_quantity_labels = self.__create_inventory_item_labels()
 
+        # Quantities currently displayed, so that unchanged quantities don't
+        # have to be written to their labels again
+        self.__item_quantities = [0] * len(self.__item_quantity_labels)
+
     def __create_inventory_item_labels(self):
         """Create and pack the labels that hold the names of all of the items
-        and their respective quantities."""
-        item_quantity_labels = {}
+        and their respective quantities. The quantity labels are returned in
+        the same order as the item labels."""
+        item_quantity_labels = []
 
         for item in self.__item_labels:
             # Create frame for this item
@@ -392,17 +492,25 @@ class EnumeratedInventory:
             )
             lbl_quantity.pack(side=RIGHT, padx=self.__padx)
 
-            item_quantity_labels[item] = lbl_quantity
+            item_quantity_labels.append(lbl_quantity)
 
-        return item_quantity_labels
+        return tuple(item_quantity_labels)
 
-    def update_item_quantity(self, item_name, quantity):
-        """Set the quantity associated with an item based on its name."""
-        self.__item_quantity_labels[item_name].configure(text=str(quantity))
+    def update_item_quantity(self, item_index, quantity):
+        """Set the quantity associated with an item based on its position in
+        the item labels the inventory was created with."""
+        if quantity == self.__item_quantities[item_index]:
+            return
+
+        self.__item_quantities[item_index] = quantity
+        self.__item_quantity_labels[item_index].configure(text=str(quantity))
 
     def clear(self):
         """Set all item quantities to zero."""
-        for item_quantity_label in self.__item_quantity_labels.values():
+        for item_index, item_quantity_label in enumerate(
+            self.__item_quantity_labels
+        ):
+            self.__item_quantities[item_index] = 0
             item_quantity_label.configure(text="0")
 
 
@@ -442,11 +550,16 @@ class CheckboxInventory:
             self.__create_inventory_item_labels()
         )
 
+        # Whether each item's box is currently checked, so that boxes that
+        # are already checked don't have to be set again
+        self.__items_held = [False] * len(
+            self.__item_check_button_control_vars
+        )
+
     def __create_inventory_item_labels(self):
         """Create and pack the labels that hold the names of all of the items
-        and their respective checkboxes."""
-        item_check_button_control_vars = {}
-
+        and their respective checkboxes. The control variables of the
+        checkboxes are returned in the same order as the item labels."""
         control_vars = [IntVar() for _ in range(len(self.__item_labels))]
 
         for ind, item in enumerate(self.__item_labels):
@@ -482,20 +595,26 @@ class CheckboxInventory:
             )
             check_btn.pack(side=RIGHT, padx=self.__padx)
 
-            item_check_button_control_vars[item] = control_vars[ind]
-
             # Mark item as not held
             control_vars[ind].set(0)
 
-        return item_check_button_control_vars
+        return tuple(control_vars)
+
+    def check_item(self, item_index):
+        """Set an item as being held, checking its box. The item is identified
+        by its position in the item labels the inventory was created with."""
+        if self.__items_held[item_index]:
+            return
 
-    def check_item(self, item_name):
-        """Set an item as being held, checking its box."""
-        self.__item_check_button_control_vars[item_name].set(1)
+        self.__items_held[item_index] = True
+        self.__item_check_button_control_vars[item_index].set(1)
 
     def clear(self):
         """Set all items as not being held, unchecking their boxes."""
-        for item_control_var in self.__item_check_button_control_vars.values():
+        for item_index, item_control_var in enumerate(
+            self.__item_check_button_control_vars
+        ):
+            self.__items_held[item_index] = False
             item_control_var.set(0)
 
 
@@ -541,11 +660,19 @@ class HPGauge:
         )
         self.__bar_hp_gauge.pack(padx=bar_padx, pady=bar_pady)
 
+        # Value currently displayed by the bar, so that it's only reconfigured
+        # when the HP actually changes
+        self.__value = None
+
         # Initialize to full health
         self.set(100)
 
     def set(self, value):
         """Set the value of HP to reflect in the gauge."""
+        if value == self.__value:
+            return
+
+        self.__value = value
         self.__bar_hp_gauge["value"] = value
 
 
@@ -563,6 +690,11 @@ class PopUpWindow:
         self._place_pop_up_at_center_of_window(self._frm, width)
         self._width = width
 
+        # Whether the pop-up is currently placed in the window. Used to skip
+        # re-placing a pop-up that is already shown or forgetting one that is
+        # already hidden.
+        self._shown = True
+
     @staticmethod
     def _place_pop_up_at_center_of_window(frame, width):
         """Position the pop-up window at the middle of the specified frame,
@@ -577,12 +709,16 @@ class PopUpWindow:
     def show(self):
         """Show the pop-up window in the middle of the center of the parent
         frame."""
-        self._place_pop_up_at_center_of_window(self._frm, self._width)
-        self._frm.update_idletasks()
+        if not self._shown:
+            self._place_pop_up_at_center_of_window(self._frm, self._width)
+            self._shown = True
+            self._frm.update_idletasks()
 
     def hide(self):
         """Hide the pop-up window."""
-        self._frm.place_forget()
+        if self._shown:
+            self._frm.place_forget()
+            self._shown = False
 
 
 class InGameMenu(PopUpWindow):
@@ -669,6 +805,9 @@ class DismissiblePopUp(PopUpWindow):
         # Create the frame for the whole in-game menu
         super().__init__(window, width)
 
+        # Text currently shown in the primary label
+        self.__text = text
+
         self.__lbl_primary = Label(
             master=self._frm,
             text=text,
@@ -693,6 +832,11 @@ class DismissiblePopUp(PopUpWindow):
     def set_text(self, text):
         """Set the underlying text content of the pop-up to the specified
         value."""
+        # Leave the label alone if its text hasn't changed
+        if text == self.__text:
+            return
+
+        self.__text = text
         self.__lbl_primary.configure(text=text)
 
 
@@ -842,14 +986,13 @@ class ShortAnswerQuestionAndAnswer(HintableQuestionAndAnswerMenu):
     def show(self):
         """Show the widget in the middle of the center of the parent frame and
         take focus."""
-        self._place_pop_up_at_center_of_window(self._frm, self._width)
+        super().show()
         self.__user_input.focus()
-        self._frm.update_idletasks()
 
     def hide(self):
         """Unfocus the free form text entry and hide the widget."""
         self._frm.focus()
-        self._frm.place_forget()
+        super().hide()
 
     def get_user_answer(self):
         """Fetch and return the player's answer."""
@@ -956,7 +1099,7 @@ class QuestionAndAnswerWithOptionsMenu(QuestionAndAnswerMenu):
 
         Parameters
         ----------
-        options : list
+        options : Sequence
             Set of possible options to display to the user.
         """
         for ind, option_text in enumerate(options):
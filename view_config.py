@@ -1,5 +1,6 @@
 """Used to define dimensions, messages, and styles for view"""
 from enum import Enum, auto
+import textwrap
 
 ##############################################################################
 # Dimensions such as width, height, and padding options
@@ -124,14 +125,16 @@ __SAVE_CONFIRMATION_MESSAGE = """
 Save game successful!
 """
 
+# NOTE: The messages shown in pop-ups are dedented once here rather than each
+# time a pop-up is created
 MESSAGES = {
     "main_menu": __WELCOME_MESSAGE,
-    "save_confirmation_menu": __SAVE_CONFIRMATION_MESSAGE,
-    "no_save_file_found_menu": __NO_SAVE_FILE_FOUND_MESSAGE,
-    "main_help_menu": __MAIN_HELP_MESSAGE,
-    "game_won_menu": __YOU_WIN_MESSAGE,
-    "game_lost_died_menu": __YOU_DIED_MESSAGE,
-    "game_lost_trapped_menu": __YOU_ARE_TRAPPED_MESSAGE,
+    "save_confirmation_menu": textwrap.dedent(__SAVE_CONFIRMATION_MESSAGE),
+    "no_save_file_found_menu": textwrap.dedent(__NO_SAVE_FILE_FOUND_MESSAGE),
+    "main_help_menu": textwrap.dedent(__MAIN_HELP_MESSAGE),
+    "game_won_menu": textwrap.dedent(__YOU_WIN_MESSAGE),
+    "game_lost_died_menu": textwrap.dedent(__YOU_DIED_MESSAGE),
+    "game_lost_trapped_menu": textwrap.dedent(__YOU_ARE_TRAPPED_MESSAGE),
     "need_magic_key_menu": "This door is permanently locked. To open it, find a magic key!",
     "use_magic_key_menu": "This door is permanently locked. To open it, use a magic key.",
     "difficulty_choice_menu": __DIFFICULTY_MENU_MESSAGE,